@@ -3,34 +3,51 @@ dcp-ai: Python SDK for the Digital Citizenship Protocol for AI Agents.
 
 Provides models, cryptographic signing/verification, schema validation,
 Merkle tree operations, and a builder for DCP Citizenship Bundles.
+
+The public API is re-exported lazily (PEP 562): submodules and their
+heavy dependencies (pydantic, PyNaCl, jsonschema) load on first use,
+keeping ``import dcp_ai`` cheap for entry points like the CLI.
 """
 
 from __future__ import annotations
 
-from typing import Any
-
-from dcp_ai.models import (
-    ResponsiblePrincipalRecord,
-    AgentPassport,
-    Intent,
-    IntentTarget,
-    PolicyDecision,
-    AuditEntry,
-    AuditEvidence,
-    CitizenshipBundle,
-    SignedBundle,
-    BundleSignature,
-    SignerInfo,
-    RevocationRecord,
-    HumanConfirmation,
-)
-from dcp_ai.crypto import generate_keypair, sign_object, verify_object, canonicalize
-from dcp_ai.merkle import hash_object, merkle_root_for_audit_entries, intent_hash, prev_hash_for_entry
-from dcp_ai.verify import verify_signed_bundle
-from dcp_ai.bundle import BundleBuilder, sign_bundle
-
-import dcp_ai.v2 as v2
-from dcp_ai.observability import dcp_telemetry
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dcp_ai.models import (
+        ResponsiblePrincipalRecord,
+        AgentPassport,
+        Intent,
+        IntentTarget,
+        PolicyDecision,
+        AuditEntry,
+        AuditEvidence,
+        CitizenshipBundle,
+        SignedBundle,
+        BundleSignature,
+        SignerInfo,
+        RevocationRecord,
+        HumanConfirmation,
+    )
+    from dcp_ai.crypto import (
+        generate_keypair,
+        sign_object,
+        verify_object,
+        canonicalize,
+        canonicalize_bytes,
+    )
+    from dcp_ai.merkle import (
+        hash_object,
+        merkle_root_for_audit_entries,
+        intent_hash,
+        prev_hash_for_entry,
+    )
+    from dcp_ai.verify import verify_signed_bundle, verify_signed_bundles
+    from dcp_ai.bundle import BundleBuilder, sign_bundle
+
+    import dcp_ai.v2 as v2
+    from dcp_ai.observability import dcp_telemetry
 
 try:
     from importlib.metadata import version as _pkg_version
@@ -61,14 +78,65 @@ def detect_dcp_version(artifact: dict[str, Any]) -> str | None:
     return None
 
 
+_SUBMODULES = {"models", "crypto", "merkle", "verify", "bundle", "schema", "v2", "observability"}
+
+# Re-exported name -> module that defines it.
+_LAZY_IMPORTS = {
+    "ResponsiblePrincipalRecord": "dcp_ai.models",
+    "AgentPassport": "dcp_ai.models",
+    "Intent": "dcp_ai.models",
+    "IntentTarget": "dcp_ai.models",
+    "PolicyDecision": "dcp_ai.models",
+    "AuditEntry": "dcp_ai.models",
+    "AuditEvidence": "dcp_ai.models",
+    "CitizenshipBundle": "dcp_ai.models",
+    "SignedBundle": "dcp_ai.models",
+    "BundleSignature": "dcp_ai.models",
+    "SignerInfo": "dcp_ai.models",
+    "RevocationRecord": "dcp_ai.models",
+    "HumanConfirmation": "dcp_ai.models",
+    "generate_keypair": "dcp_ai.crypto",
+    "sign_object": "dcp_ai.crypto",
+    "verify_object": "dcp_ai.crypto",
+    "canonicalize": "dcp_ai.crypto",
+    "canonicalize_bytes": "dcp_ai.crypto",
+    "hash_object": "dcp_ai.merkle",
+    "merkle_root_for_audit_entries": "dcp_ai.merkle",
+    "intent_hash": "dcp_ai.merkle",
+    "prev_hash_for_entry": "dcp_ai.merkle",
+    "verify_signed_bundle": "dcp_ai.verify",
+    "verify_signed_bundles": "dcp_ai.verify",
+    "BundleBuilder": "dcp_ai.bundle",
+    "sign_bundle": "dcp_ai.bundle",
+    "dcp_telemetry": "dcp_ai.observability",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        module = importlib.import_module(f"dcp_ai.{name}")
+        globals()[name] = module
+        return module
+    source = _LAZY_IMPORTS.get(name)
+    if source is not None:
+        value = getattr(importlib.import_module(source), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "ResponsiblePrincipalRecord", "AgentPassport", "Intent", "IntentTarget",
     "PolicyDecision", "AuditEntry", "AuditEvidence",
     "CitizenshipBundle", "SignedBundle", "BundleSignature", "SignerInfo",
     "RevocationRecord", "HumanConfirmation",
-    "generate_keypair", "sign_object", "verify_object", "canonicalize",
+    "generate_keypair", "sign_object", "verify_object", "canonicalize", "canonicalize_bytes",
     "hash_object", "merkle_root_for_audit_entries", "intent_hash", "prev_hash_for_entry",
-    "verify_signed_bundle",
+    "verify_signed_bundle", "verify_signed_bundles",
     "BundleBuilder", "sign_bundle",
     "v2",
     "detect_dcp_version",
@@ -0,0 +1,32 @@
+"""
+Internal JSON parsing helpers — orjson when available, stdlib otherwise.
+
+orjson decodes UTF-8 bytes straight to Python objects in C and is
+several times faster than the stdlib parser on the small documents DCP
+handles (bundle headers, signed bundles, tool arguments). It is an
+optional dependency; without it everything falls back to stdlib json.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+if _orjson is not None:
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Parse JSON from bytes or str (orjson fast path)."""
+        return _orjson.loads(data)
+
+else:
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Parse JSON from bytes or str (stdlib fallback)."""
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
@@ -8,8 +8,13 @@ import hashlib
 from datetime import datetime, timezone
 from typing import Any
 
-from dcp_ai.crypto import canonicalize, sign_object, public_key_from_secret
-from dcp_ai.merkle import hash_object, intent_hash, merkle_root_for_audit_entries
+from dcp_ai._json import loads as _json_loads
+from dcp_ai.crypto import canonical_and_sign, canonicalize_bytes, public_key_from_secret
+from dcp_ai.merkle import (
+    intent_hash,
+    merkle_root_for_audit_entries,
+    merkle_root_from_byte_leaves,
+)
 from dcp_ai.models import (
     CitizenshipBundle,
     ResponsiblePrincipalRecord,
@@ -20,6 +25,8 @@ from dcp_ai.models import (
     AuditEvidence,
 )
 
+_UTC = timezone.utc
+
 
 class BundleBuilder:
     """Fluent builder for DCP Citizenship Bundles."""
@@ -30,6 +37,12 @@ class BundleBuilder:
         self._intent: Intent | None = None
         self._policy: PolicyDecision | None = None
         self._audit_entries: list[AuditEntry] = []
+        # Chain caches: the previous entry's hash plus each entry's
+        # canonical bytes, so appending entry N doesn't re-serialize the
+        # N-1 entries already in the chain.
+        self._last_hash = "GENESIS"
+        self._entry_canon: list[bytes] = []
+        self._intent_hash: str | None = None
 
     def responsible_principal_record(self, rpr: ResponsiblePrincipalRecord) -> BundleBuilder:
         self._rpr = rpr
@@ -41,6 +54,9 @@ class BundleBuilder:
 
     def intent(self, intent: Intent) -> BundleBuilder:
         self._intent = intent
+        # The intent is fixed for the rest of the build, so hash it now
+        # instead of once per audit entry.
+        self._intent_hash = intent_hash(intent.model_dump())
         return self
 
     def policy_decision(self, policy: PolicyDecision) -> BundleBuilder:
@@ -49,6 +65,12 @@ class BundleBuilder:
 
     def add_audit_entry(self, entry: AuditEntry) -> BundleBuilder:
         self._audit_entries.append(entry)
+        # model_dump_json serializes in pydantic's Rust core; parsing it
+        # back measures faster than building the dict via model_dump,
+        # and canonicalize_bytes re-sorts the keys either way.
+        canon = canonicalize_bytes(_json_loads(entry.model_dump_json()))
+        self._entry_canon.append(canon)
+        self._last_hash = hashlib.sha256(canon).hexdigest()
         return self
 
     def create_audit_entry(
@@ -67,12 +89,8 @@ class BundleBuilder:
         if not self._intent:
             raise ValueError("Intent must be set before creating audit entries")
 
-        i_hash = intent_hash(self._intent.model_dump())
-        prev_hash = (
-            "GENESIS"
-            if not self._audit_entries
-            else hash_object(self._audit_entries[-1].model_dump())
-        )
+        i_hash = self._intent_hash or intent_hash(self._intent.model_dump())
+        prev_hash = self._last_hash
 
         entry = AuditEntry(
             audit_id=audit_id,
@@ -86,8 +104,7 @@ class BundleBuilder:
             outcome=outcome,
             evidence=evidence or AuditEvidence(),
         )
-        self._audit_entries.append(entry)
-        return self
+        return self.add_audit_entry(entry)
 
     def build(self) -> CitizenshipBundle:
         """Build the Citizenship Bundle. Raises ValueError if any required artifact is missing."""
@@ -110,30 +127,59 @@ class BundleBuilder:
             audit_entries=self._audit_entries,
         )
 
+    def sign(
+        self,
+        secret_key_b64: str,
+        signer_type: str = "human",
+        signer_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Build and sign in one step.
+
+        Hands the cached canonical entry bytes to :func:`sign_bundle` so
+        the Merkle root reuses them instead of re-serializing the trail.
+        """
+        return sign_bundle(
+            self.build(),
+            secret_key_b64,
+            signer_type,
+            signer_id,
+            audit_entry_canon=list(self._entry_canon),
+        )
+
 
 def sign_bundle(
     bundle: CitizenshipBundle,
     secret_key_b64: str,
     signer_type: str = "human",
     signer_id: str | None = None,
+    audit_entry_canon: list[bytes] | None = None,
 ) -> dict[str, Any]:
-    """Sign a Citizenship Bundle and produce a Signed Bundle dict."""
+    """Sign a Citizenship Bundle and produce a Signed Bundle dict.
+
+    ``audit_entry_canon`` optionally supplies the canonical bytes of each
+    audit entry (as cached by :class:`BundleBuilder`), so the Merkle root
+    is computed without re-serializing the entries.
+    """
     bundle_dict = bundle.model_dump()
     public_key_b64 = public_key_from_secret(secret_key_b64)
 
-    bundle_hash_hex = hashlib.sha256(
-        canonicalize(bundle_dict).encode("utf-8")
-    ).hexdigest()
+    # Canonicalize the bundle once; the hash and the signature both
+    # derive from the same bytes.
+    _, bundle_hash_hex, sig_b64 = canonical_and_sign(bundle_dict, secret_key_b64)
 
-    merkle_hex = merkle_root_for_audit_entries(bundle_dict.get("audit_entries", []))
-
-    sig_b64 = sign_object(bundle_dict, secret_key_b64)
+    if audit_entry_canon is not None:
+        root = merkle_root_from_byte_leaves(
+            [hashlib.sha256(c).digest() for c in audit_entry_canon]
+        )
+        merkle_hex = root.hex() if root is not None else None
+    else:
+        merkle_hex = merkle_root_for_audit_entries(bundle_dict.get("audit_entries", []))
 
     return {
         "bundle": bundle_dict,
         "signature": {
             "alg": "ed25519",
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": datetime.now(_UTC).isoformat(),
             "signer": {
                 "type": signer_type,
                 "id": signer_id or bundle.responsible_principal_record.human_id,
@@ -5,16 +5,23 @@ Built with Typer.
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 from pathlib import Path
+from typing import Any
 
 import typer
 
 app = typer.Typer(name="dcp", help="Digital Citizenship Protocol CLI")
 
 
+def _load(path: str) -> Any:
+    """Parse a JSON file, feeding raw bytes to the fastest parser available."""
+    from dcp_ai._json import loads
+
+    return loads(Path(path).read_bytes())
+
+
 def _write_secret_atomic(path: Path, contents: str) -> None:
     """Write `contents` to `path` with mode 0600 from creation — no race window.
 
@@ -86,7 +93,7 @@ def validate(schema_name: str, json_path: str) -> None:
     """Validate a JSON file against a DCP schema."""
     from dcp_ai.schema import validate_schema
 
-    data = json.loads(Path(json_path).read_text())
+    data = _load(json_path)
     result = validate_schema(schema_name, data)
     if result["valid"]:
         typer.echo(f"VALID ({schema_name})")
@@ -101,7 +108,7 @@ def validate_bundle(bundle_path: str) -> None:
     """Validate a Citizenship Bundle JSON file."""
     from dcp_ai.schema import validate_bundle as _validate_bundle
 
-    bundle = json.loads(Path(bundle_path).read_text())
+    bundle = _load(bundle_path)
     result = _validate_bundle(bundle)
     if result["valid"]:
         typer.echo("BUNDLE VALID (DCP-01/02/03)")
@@ -116,7 +123,7 @@ def verify(signed_path: str, public_key_path: str | None = None) -> None:
     """Verify a signed bundle."""
     from dcp_ai.verify import verify_signed_bundle
 
-    signed_bundle = json.loads(Path(signed_path).read_text())
+    signed_bundle = _load(signed_path)
     pk_b64 = Path(public_key_path).read_text().strip() if public_key_path else None
     result = verify_signed_bundle(signed_bundle, pk_b64)
     if result["verified"]:
@@ -133,10 +140,10 @@ def verify(signed_path: str, public_key_path: str | None = None) -> None:
 def bundle_hash(bundle_path: str) -> None:
     """Compute the SHA-256 hash of a bundle."""
     import hashlib
-    from dcp_ai.crypto import canonicalize
+    from dcp_ai.crypto import canonicalize_bytes
 
-    bundle = json.loads(Path(bundle_path).read_text())
-    hex_hash = hashlib.sha256(canonicalize(bundle).encode("utf-8")).hexdigest()
+    bundle = _load(bundle_path)
+    hex_hash = hashlib.sha256(canonicalize_bytes(bundle)).hexdigest()
     typer.echo(f"sha256:{hex_hash}")
 
 
@@ -145,7 +152,7 @@ def merkle_root(bundle_path: str) -> None:
     """Compute the Merkle root of audit_entries in a bundle."""
     from dcp_ai.merkle import merkle_root_for_audit_entries
 
-    bundle = json.loads(Path(bundle_path).read_text())
+    bundle = _load(bundle_path)
     entries = bundle.get("audit_entries", [])
     if not entries:
         typer.echo("audit_entries must be a non-empty array", err=True)
@@ -159,7 +166,7 @@ def intent_hash_cmd(intent_path: str) -> None:
     """Compute the intent_hash for an Intent JSON file."""
     from dcp_ai.merkle import intent_hash
 
-    intent = json.loads(Path(intent_path).read_text())
+    intent = _load(intent_path)
     typer.echo(intent_hash(intent))
 
 
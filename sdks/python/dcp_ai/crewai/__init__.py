@@ -29,68 +29,40 @@ Usage:
 from __future__ import annotations
 
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from heapq import merge
+from operator import itemgetter
 from typing import Any, Optional
-from uuid import uuid4
-
-from dcp_ai.v2.models import (
-    IntentV2,
-    AuditEventV2,
+from secrets import token_hex
+
+from dcp_ai.merkle import IncrementalMerkleTree
+from dcp_ai.v2.fast_records import (
+    AuditEntryCanonicalizer,
+    audit_event_dict,
+    hash_record,
+    intent_dict,
+    iso_now_utc,
 )
-from dcp_ai.v2.canonicalize import canonicalize_v2
-from dcp_ai.v2.dual_hash import sha256_hex
-
-
-def _hash_object(obj: Any) -> str:
-    canonical = canonicalize_v2(obj)
-    return f"sha256:{sha256_hex(canonical.encode('utf-8'))}"
 
 
 def _generate_session_nonce() -> str:
     return os.urandom(32).hex()
 
 
-SENSITIVE_DATA_CLASSES = {"pii", "financial_data", "health_data", "credentials", "children_data"}
-HIGH_VALUE_DATA_CLASSES = {"credentials", "children_data"}
-
-
-def _compute_risk_score(action_type: str, impact: str, data_classes: list[str]) -> int:
-    impact_scores = {"low": 200, "medium": 500, "high": 900}
-    action_weights = {
-        "browse": 100, "api_call": 300, "send_email": 500,
-        "create_calendar_event": 200, "initiate_payment": 900,
-        "update_crm": 400, "write_file": 400, "execute_code": 700,
-    }
-    base = impact_scores.get(impact, 500)
-    action_w = action_weights.get(action_type, 300)
-    sensitive_count = sum(1 for d in data_classes if d in SENSITIVE_DATA_CLASSES)
-    return min(1000, round((base + action_w) / 2 + sensitive_count * 150))
-
-
-def _compute_security_tier(
-    risk_score: int,
-    data_classes: list[str],
-    action_type: str,
-) -> str:
-    has_high_value = any(d in HIGH_VALUE_DATA_CLASSES for d in data_classes)
-    has_sensitive = any(d in SENSITIVE_DATA_CLASSES for d in data_classes)
-    is_payment = action_type == "initiate_payment"
-
-    if risk_score >= 800 or has_high_value:
-        return "maximum"
-    if risk_score >= 500 or has_sensitive or is_payment:
-        return "elevated"
-    if risk_score >= 200:
-        return "standard"
-    return "routine"
-
-
 class DCPCrewAgent:
     """
     A CrewAI-compatible agent with V2 DCP citizenship.
     Each agent has its own passport, audit trail, and session binding.
     """
 
+    __slots__ = (
+        "role", "passport", "rpr", "secret_key", "session_nonce", "goal",
+        "backstory", "lifecycle_state", "audit_trail", "_prev_hash", "_imt",
+        "_agent_id", "_human_id", "_crewai_tool", "_entry_canon",
+    )
+
     def __init__(
         self,
         role: str,
@@ -100,6 +72,7 @@ class DCPCrewAgent:
         session_nonce: str = "",
         goal: str = "",
         backstory: str = "",
+        audit_max_len: int = 65536,
     ) -> None:
         self.role = role
         self.passport = passport
@@ -109,8 +82,18 @@ class DCPCrewAgent:
         self.goal = goal
         self.backstory = backstory
         self.lifecycle_state: str = "active"
-        self.audit_trail: list[dict[str, Any]] = []
+        # Bounded ring: long-lived agents drop the oldest entries, which
+        # remain covered by the incremental Merkle root.
+        self.audit_trail: deque[dict[str, Any]] = deque(maxlen=audit_max_len)
         self._prev_hash = "GENESIS"
+        self._imt = IncrementalMerkleTree()
+        # Cached per-agent constants — looked up on every audit event.
+        self._agent_id = passport.get("agent_id", "")
+        self._human_id = rpr.get("human_id", "")
+        self._crewai_tool = f"crewai:{role}"
+        self._entry_canon = AuditEntryCanonicalizer(
+            self._agent_id, self._human_id, self.session_nonce
+        )
 
     def commission(
         self,
@@ -122,9 +105,9 @@ class DCPCrewAgent:
         now = datetime.now(timezone.utc).isoformat()
         cert = {
             "dcp_version": "2.0",
-            "certificate_id": f"cert-{uuid4().hex[:8]}",
+            "certificate_id": f"cert-{token_hex(4)}",
             "session_nonce": self.session_nonce,
-            "agent_id": self.passport.get("agent_id", ""),
+            "agent_id": self._agent_id,
             "purpose": purpose or f"Crew role: {self.role}",
             "initial_capabilities": capabilities or self.passport.get("capabilities", []),
             "risk_tier": risk_tier,
@@ -135,7 +118,7 @@ class DCPCrewAgent:
         self.log_action(
             action_type="api_call",
             outcome="agent_commissioned",
-            evidence={"tool": f"crewai:{self.role}", "_spec_ref": "DCP-05 §3.1"},
+            evidence={"tool": self._crewai_tool, "_spec_ref": "DCP-05 §3.1"},
         )
         return cert
 
@@ -149,9 +132,9 @@ class DCPCrewAgent:
         score = tcr * 0.3 + (1 - er) * 0.2 + hs * 0.25 + pa * 0.25
         report = {
             "dcp_version": "2.0",
-            "report_id": f"vitality-{uuid4().hex[:8]}",
+            "report_id": f"vitality-{token_hex(4)}",
             "session_nonce": self.session_nonce,
-            "agent_id": self.passport.get("agent_id", ""),
+            "agent_id": self._agent_id,
             "metrics": metrics,
             "vitality_score": round(score, 4),
             "timestamp": now,
@@ -166,9 +149,9 @@ class DCPCrewAgent:
         now = datetime.now(timezone.utc).isoformat()
         record = {
             "dcp_version": "2.0",
-            "record_id": f"decom-{uuid4().hex[:8]}",
+            "record_id": f"decom-{token_hex(4)}",
             "session_nonce": self.session_nonce,
-            "agent_id": self.passport.get("agent_id", ""),
+            "agent_id": self._agent_id,
             "termination_mode": mode,
             "reason": reason,
             "timestamp": now,
@@ -186,9 +169,9 @@ class DCPCrewAgent:
         now = datetime.now(timezone.utc).isoformat()
         testament = {
             "dcp_version": "2.0",
-            "testament_id": f"testament-{uuid4().hex[:8]}",
+            "testament_id": f"testament-{token_hex(4)}",
             "session_nonce": self.session_nonce,
-            "agent_id": self.passport.get("agent_id", ""),
+            "agent_id": self._agent_id,
             "successor_preferences": successor_preferences,
             "memory_classification": memory_classification,
             "timestamp": now,
@@ -210,46 +193,45 @@ class DCPCrewAgent:
                 f"Agent {self.passport.get('agent_id', self.role)} is decommissioned (DCP-05 §5.1)"
             )
         dc = data_classes or ["none"]
-        risk_score = _compute_risk_score(action_type, impact, dc)
-        tier = _compute_security_tier(risk_score, dc, action_type)
-        intent = IntentV2(
-            dcp_version="2.0",
-            intent_id=f"intent-{uuid4().hex[:8]}",
+        intent_id = f"intent-{token_hex(4)}"
+        now_iso = iso_now_utc()
+        intent = intent_dict(
+            intent_id=intent_id,
             session_nonce=self.session_nonce,
-            agent_id=self.passport.get("agent_id", ""),
-            human_id=self.rpr.get("human_id", ""),
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            agent_id=self._agent_id,
+            human_id=self._human_id,
+            timestamp=now_iso,
             action_type=action_type,
             target={"channel": "api"},
             data_classes=dc,
             estimated_impact=impact,
-            security_tier=tier,
         )
-        i_hash = _hash_object(intent.model_dump())
+        i_hash = hash_record(intent)
 
-        entry = AuditEventV2(
-            dcp_version="2.0",
-            audit_id=f"audit-{uuid4().hex[:8]}",
+        entry_dict = audit_event_dict(
+            audit_id=f"audit-{token_hex(4)}",
             session_nonce=self.session_nonce,
             prev_hash=self._prev_hash,
-            hash_alg="sha256",
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            agent_id=self.passport.get("agent_id", ""),
-            human_id=self.rpr.get("human_id", ""),
-            intent_id=intent.intent_id,
+            timestamp=now_iso,
+            agent_id=self._agent_id,
+            human_id=self._human_id,
+            intent_id=intent_id,
             intent_hash=i_hash,
             policy_decision="approved",
             outcome=outcome,
-            evidence=evidence or {"tool": f"crewai:{self.role}"},
-            pq_checkpoint_ref=None,
+            evidence=evidence or {"tool": self._crewai_tool},
         )
-        entry_dict = entry.model_dump()
-        self._prev_hash = _hash_object(entry_dict)
+        self._prev_hash = self._entry_canon.hash(entry_dict)
         self.audit_trail.append(entry_dict)
+        self._imt.append(entry_dict)
         return entry_dict
 
     def get_audit_trail(self) -> list[dict[str, Any]]:
-        return self.audit_trail
+        return list(self.audit_trail)
+
+    def get_merkle_root(self) -> Optional[str]:
+        """Merkle root of this agent's audit trail (incrementally maintained)."""
+        return self._imt.root()
 
     def get_session_nonce(self) -> str:
         return self.session_nonce
@@ -285,35 +267,69 @@ class DCPCrew:
             agent.log_action(
                 action_type="api_call",
                 outcome=f"participated_in_task:{task[:50]}",
-                evidence={"tool": f"crewai:{agent.role}", "result_ref": None},
+                evidence={"tool": agent._crewai_tool, "result_ref": None},
             )
             results["agents"].append({
                 "role": agent.role,
-                "agent_id": agent.passport.get("agent_id", ""),
+                "agent_id": agent._agent_id,
                 "session_nonce": agent.session_nonce,
                 "audit_entries": len(agent.audit_trail),
             })
 
         return results
 
+    def kickoff_parallel(
+        self, task: str, max_workers: Optional[int] = None
+    ) -> dict[str, Any]:
+        """
+        Run the crew with each agent participating from its own worker
+        thread.
+
+        No locking is needed: each agent's audit_trail, _prev_hash and
+        Merkle frontier have a single writer (its own worker), and the
+        combined trail is only read after all workers finish — the same
+        per-agent isolation kickoff() relies on, just concurrent.
+        """
+        results: dict[str, Any] = {"task": task, "agents": [], "dcp_version": "2.0"}
+
+        def participate(agent: DCPCrewAgent) -> dict[str, Any]:
+            agent.log_action(
+                action_type="api_call",
+                outcome=f"participated_in_task:{task[:50]}",
+                evidence={"tool": agent._crewai_tool, "result_ref": None},
+            )
+            return {
+                "role": agent.role,
+                "agent_id": agent._agent_id,
+                "session_nonce": agent.session_nonce,
+                "audit_entries": len(agent.audit_trail),
+            }
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results["agents"] = list(pool.map(participate, self.agents))
+
+        return results
+
     def get_combined_audit_trail(self) -> list[dict[str, Any]]:
         """Get combined V2 audit trail from all agents, sorted by timestamp."""
-        combined: list[dict[str, Any]] = []
-        for agent in self.agents:
+
+        def tagged(agent: DCPCrewAgent):
+            role = agent.role
             for entry in agent.audit_trail:
-                combined.append({
-                    **entry,
-                    "_agent_role": agent.role,
-                })
-        combined.sort(key=lambda e: e.get("timestamp", ""))
-        return combined
+                yield {**entry, "_agent_role": role}
+
+        # Per-agent trails are appended chronologically, so an O(N log k)
+        # k-way merge replaces the full O(N log N) sort.
+        return list(
+            merge(*(tagged(a) for a in self.agents), key=itemgetter("timestamp"))
+        )
 
     def get_agent_bundles(self) -> dict[str, list[dict[str, Any]]]:
         """Get per-agent V2 audit trails keyed by agent_id."""
         bundles: dict[str, list[dict[str, Any]]] = {}
         for agent in self.agents:
             agent_id = agent.passport.get("agent_id", agent.role)
-            bundles[agent_id] = agent.audit_trail
+            bundles[agent_id] = list(agent.audit_trail)
         return bundles
 
     def commission_all(self, purpose: str = "") -> list[dict[str, Any]]:
@@ -331,7 +347,7 @@ class DCPCrew:
         now = datetime.now(timezone.utc).isoformat()
         record = {
             "dcp_version": "2.0",
-            "record_id": f"succession-{uuid4().hex[:8]}",
+            "record_id": f"succession-{token_hex(4)}",
             "session_nonce": self.session_nonce,
             "predecessor_agent_id": from_agent.passport.get("agent_id", from_agent.role),
             "successor_agent_id": to_agent.passport.get("agent_id", to_agent.role),
@@ -350,7 +366,7 @@ class DCPCrew:
         now = datetime.now(timezone.utc).isoformat()
         mandate = {
             "dcp_version": "2.0",
-            "mandate_id": f"mandate-{uuid4().hex[:8]}",
+            "mandate_id": f"mandate-{token_hex(4)}",
             "session_nonce": self.session_nonce,
             "human_id": human_id,
             "agent_id": agent.passport.get("agent_id", agent.role),
@@ -5,23 +5,66 @@ Uses PyNaCl for cryptographic operations.
 
 from __future__ import annotations
 
+import base64
+import functools
+import hashlib
 import json
 from typing import Any
 
 import nacl.signing
 import nacl.encoding
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+
+def _orjson_safe(value: Any) -> bool:
+    """True when orjson and stdlib json emit identical canonical text.
+
+    The outputs differ only for floats (exponent formatting: stdlib
+    ``1e+22`` vs orjson ``1e22``), and orjson raises on inputs stdlib
+    serializes fine: tuples, integers beyond 64 bits, and non-string
+    dict keys (all reachable from valid JSON or model dumps). Any of
+    those routes to the stdlib path.
+    """
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return True
+    if isinstance(value, int):
+        return -(2**63) <= value <= 2**64 - 1
+    if isinstance(value, dict):
+        return all(
+            isinstance(k, str) and _orjson_safe(v) for k, v in value.items()
+        )
+    if isinstance(value, list):
+        return all(_orjson_safe(v) for v in value)
+    return False
+
+
+def canonicalize_bytes(obj: Any) -> bytes:
+    """Canonical JSON serialization as UTF-8 bytes.
+
+    Hashing and signing consume bytes, so hot paths call this directly
+    and skip the str round trip: orjson already produces bytes, and the
+    stdlib fallback encodes exactly once.
+    """
+    if _orjson is not None and _orjson_safe(obj):
+        return _orjson.dumps(obj, option=_orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
 
 def canonicalize(obj: Any) -> str:
     """Canonical JSON serialization (deterministic key ordering, no whitespace)."""
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return canonicalize_bytes(obj).decode("utf-8")
 
 
 def generate_keypair() -> dict[str, str]:
     """Generate a new Ed25519 keypair. Returns dict with public_key_b64 and secret_key_b64."""
     signing_key = nacl.signing.SigningKey.generate()
     verify_key = signing_key.verify_key
-    import base64
     sk_bytes = signing_key.encode() + verify_key.encode()
     return {
         "public_key_b64": verify_key.encode(encoder=nacl.encoding.Base64Encoder).decode("ascii"),
@@ -30,26 +73,42 @@ def generate_keypair() -> dict[str, str]:
 
 
 def _to_b64(data: bytes) -> str:
-    import base64
     return base64.b64encode(data).decode("ascii")
 
 
 def _from_b64(s: str) -> bytes:
-    import base64
     return base64.b64decode(s)
 
 
-def sign_object(obj: Any, secret_key_b64: str) -> str:
-    """Sign a JSON object with Ed25519 (detached). Returns base64 signature."""
+@functools.lru_cache(maxsize=256)
+def _signing_key_from_b64(secret_key_b64: str) -> nacl.signing.SigningKey:
+    """Decode a base64 secret and build the SigningKey once per key.
+
+    Services sign many bundles with the same key; caching skips the
+    base64 decode and key-object construction on every call.
+    """
+    return nacl.signing.SigningKey(_from_b64(secret_key_b64)[:32])
+
+
+@functools.lru_cache(maxsize=256)
+def _verify_key_from_b64(public_key_b64: str) -> nacl.signing.VerifyKey:
+    """Decode a base64 public key and build the VerifyKey once per key."""
+    return nacl.signing.VerifyKey(_from_b64(public_key_b64))
+
+
+def sign_bytes(msg: bytes, secret_key_b64: str) -> str:
+    """Sign already-canonicalized bytes with Ed25519 (detached). Returns base64 signature.
+
+    Lets callers that hold the canonical serialization sign it directly
+    instead of re-canonicalizing the object.
+    """
     from dcp_ai.observability.telemetry import dcp_telemetry
     import time as _time
 
     span_id = dcp_telemetry.start_span("dcp.sign", {"algorithm": "ed25519"})
     t0 = _time.perf_counter()
     try:
-        msg = canonicalize(obj).encode("utf-8")
-        sk_bytes = _from_b64(secret_key_b64)
-        signing_key = nacl.signing.SigningKey(sk_bytes[:32])
+        signing_key = _signing_key_from_b64(secret_key_b64)
         signed = signing_key.sign(msg)
         # Detached signature is the first 64 bytes
         result = _to_b64(signed.signature)
@@ -62,6 +121,22 @@ def sign_object(obj: Any, secret_key_b64: str) -> str:
     return result
 
 
+def sign_object(obj: Any, secret_key_b64: str) -> str:
+    """Sign a JSON object with Ed25519 (detached). Returns base64 signature."""
+    return sign_bytes(canonicalize_bytes(obj), secret_key_b64)
+
+
+def canonical_and_sign(obj: Any, secret_key_b64: str) -> tuple[bytes, str, str]:
+    """Canonicalize once and derive both the SHA-256 hash and signature.
+
+    Returns (canonical_bytes, sha256_hex, sig_b64). Callers that need
+    hash and signature of the same object — bundle signing — get both
+    from a single serialization pass.
+    """
+    canon = canonicalize_bytes(obj)
+    return canon, hashlib.sha256(canon).hexdigest(), sign_bytes(canon, secret_key_b64)
+
+
 def verify_object(obj: Any, signature_b64: str, public_key_b64: str) -> bool:
     """Verify an Ed25519 detached signature on a JSON object."""
     from dcp_ai.observability.telemetry import dcp_telemetry
@@ -70,10 +145,9 @@ def verify_object(obj: Any, signature_b64: str, public_key_b64: str) -> bool:
     span_id = dcp_telemetry.start_span("dcp.verify", {"algorithm": "ed25519"})
     t0 = _time.perf_counter()
     try:
-        msg = canonicalize(obj).encode("utf-8")
+        msg = canonicalize_bytes(obj)
         sig = _from_b64(signature_b64)
-        pk_bytes = _from_b64(public_key_b64)
-        verify_key = nacl.signing.VerifyKey(pk_bytes)
+        verify_key = _verify_key_from_b64(public_key_b64)
         try:
             verify_key.verify(msg, sig)
             ok = True
@@ -88,8 +162,8 @@ def verify_object(obj: Any, signature_b64: str, public_key_b64: str) -> bool:
     return ok
 
 
+@functools.lru_cache(maxsize=256)
 def public_key_from_secret(secret_key_b64: str) -> str:
     """Derive the public key from a secret key (base64)."""
-    sk_bytes = _from_b64(secret_key_b64)
-    signing_key = nacl.signing.SigningKey(sk_bytes[:32])
+    signing_key = _signing_key_from_b64(secret_key_b64)
     return _to_b64(signing_key.verify_key.encode())
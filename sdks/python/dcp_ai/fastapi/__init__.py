@@ -18,17 +18,20 @@ Usage:
 
 from __future__ import annotations
 
+import copy
 import hashlib
-import json
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from time import monotonic
 from typing import Any, Optional
 
 from fastapi import Request, HTTPException, Depends
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
+from dcp_ai._json import loads as _json_loads
 
-@dataclass
+
+@dataclass(slots=True)
 class DCPAgentContext:
     """Verified DCP agent context injected into requests."""
     dcp_version: str = "1.0"
@@ -136,10 +139,114 @@ def _verify_v2_structure(signed_bundle: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-class DCPVerifyMiddleware(BaseHTTPMiddleware):
+def _verify_and_build_context(
+    signed_bundle: dict[str, Any],
+) -> tuple[Optional[DCPAgentContext], Optional[dict[str, Any]]]:
+    """Verify a signed bundle (V1 or V2) and build the agent context.
+
+    Returns (context, None) on success or (None, error_content) with the
+    JSON body to send as a 403.
+    """
+    version = _detect_version(signed_bundle)
+
+    if version == "2.0":
+        result = _verify_v2_structure(signed_bundle)
+        if not result["verified"]:
+            return None, {
+                "verified": False,
+                "dcp_version": "2.0",
+                "errors": result["errors"],
+            }
+
+        bundle = signed_bundle.get("bundle", {})
+        passport_payload = bundle.get("agent_passport", {}).get("payload", {})
+        rpr_payload = bundle.get("responsible_principal_record", {}).get("payload", {})
+        intent_payload = bundle.get("intent", {}).get("payload", {})
+        policy_payload = bundle.get("policy_decision", {}).get("payload", {})
+
+        is_blinded = rpr_payload.get("blinded", False) is True
+        cs = signed_bundle.get("signature", {}).get("composite_sig", {})
+
+        lifecycle_state = passport_payload.get("status", "active")
+
+        return DCPAgentContext(
+            dcp_version="2.0",
+            agent_id=passport_payload.get("agent_id", ""),
+            human_id=rpr_payload.get("human_id", ""),
+            session_nonce=result.get("session_nonce", ""),
+            capabilities=passport_payload.get("capabilities", []),
+            risk_tier=passport_payload.get("risk_tier", "medium"),
+            status=passport_payload.get("status", "active"),
+            passport=passport_payload,
+            rpr=rpr_payload,
+            intent=intent_payload,
+            policy_decision=policy_payload,
+            composite_sig_valid=cs.get("binding") == "pq_over_classical",
+            session_binding_valid=True,
+            blinded_rpr=is_blinded,
+            lifecycle_state=lifecycle_state,
+        ), None
+
+    from dcp_ai.verify import verify_signed_bundle
+
+    result = verify_signed_bundle(signed_bundle)
+    if not result["verified"]:
+        return None, {"verified": False, "errors": result.get("errors", [])}
+
+    bundle = signed_bundle.get("bundle", {})
+    passport = bundle.get("agent_passport", {})
+    rpr = bundle.get("responsible_principal_record", {})
+
+    return DCPAgentContext(
+        dcp_version="1.0",
+        agent_id=passport.get("agent_id", ""),
+        human_id=rpr.get("human_id", ""),
+        public_key=passport.get("public_key", ""),
+        capabilities=passport.get("capabilities", []),
+        risk_tier=passport.get("risk_tier", "medium"),
+        status=passport.get("status", "active"),
+        passport=passport,
+        rpr=rpr,
+        intent=bundle.get("intent", {}),
+    ), None
+
+
+class _TTLCache:
+    """Small LRU cache with a per-entry TTL (stdlib-only)."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires < monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        data = self._data
+        if key in data:
+            data.move_to_end(key)
+        elif len(data) >= self.maxsize:
+            data.popitem(last=False)
+        data[key] = (monotonic() + self.ttl, value)
+
+
+class DCPVerifyMiddleware:
     """
-    FastAPI middleware that verifies DCP signed bundles (V1 and V2).
+    Pure ASGI middleware that verifies DCP signed bundles (V1 and V2).
     Extracts bundle from X-DCP-Bundle header or request body.
+
+    Implemented directly against the ASGI interface (no BaseHTTPMiddleware)
+    so requests without a bundle pass through as a plain coroutine call —
+    no Request object, no response streaming wrappers.
     """
 
     def __init__(
@@ -148,107 +255,139 @@ class DCPVerifyMiddleware(BaseHTTPMiddleware):
         require_bundle: bool = False,
         header_name: str = "x-dcp-bundle",
         dcp_version: str = "2.0",
+        cache_size: int = 4096,
+        cache_ttl: float = 60.0,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.require_bundle = require_bundle
         self.header_name = header_name
+        self._header_name_bytes = header_name.lower().encode("latin-1")
         self.dcp_version = dcp_version
+        # Agents replay the same signed bundle across bursts of requests;
+        # memoize verification on the exact header bytes so repeats skip
+        # the crypto entirely. Set cache_size=0 to disable.
+        self._verify_cache = _TTLCache(cache_size, cache_ttl) if cache_size > 0 else None
+
+    # Cap on bodies the fallback will buffer: bundles are small JSON
+    # documents; anything larger is a payload we must not materialise here.
+    MAX_FALLBACK_BODY_BYTES = 64 * 1024
+
+    def _body_fallback_eligible(self, content_type: bytes, content_length: int) -> bool:
+        """Only inspect the body for small JSON requests.
+
+        Large uploads and non-JSON (multipart, streams) pass through
+        untouched so the middleware never buffers them.
+        """
+        if not content_type.startswith(b"application/json"):
+            return False
+        return 0 <= content_length <= self.MAX_FALLBACK_BODY_BYTES
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Permissive deployments only ever need the bundle header; the
+        # body-fallback metadata is collected solely when a bundle is
+        # required, keeping the common no-bundle path a header scan.
+        need_body_meta = self.require_bundle
+        header_value: Optional[bytes] = None
+        content_type = b""
+        content_length = -1
+        for key, value in scope["headers"]:
+            if key == self._header_name_bytes:
+                header_value = value
+            elif need_body_meta and key == b"content-type":
+                content_type = value
+            elif need_body_meta and key == b"content-length":
+                try:
+                    content_length = int(value)
+                except ValueError:
+                    pass
 
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
         signed_bundle = None
-
-        header_value = request.headers.get(self.header_name)
+        cache_key: Optional[bytes] = None
+        cached: Optional[tuple[Optional[DCPAgentContext], Optional[dict[str, Any]]]] = None
         if header_value:
+            if self._verify_cache is not None:
+                cache_key = hashlib.blake2b(header_value, digest_size=16).digest()
+                cached = self._verify_cache.get(cache_key)
+            if cached is None:
+                try:
+                    # Raw header bytes go straight to the parser — no str decode.
+                    signed_bundle = _json_loads(header_value)
+                except (TypeError, ValueError):
+                    pass
+
+        if (
+            not signed_bundle
+            and cached is None
+            and self.require_bundle
+            and self._body_fallback_eligible(content_type, content_length)
+        ):
+            # Body fallback: buffer the request body so it can be replayed
+            # to the downstream app, then look for a "signed_bundle" key.
+            # Whatever this path yields did NOT come from the header, so it
+            # must never be cached under the header's key — a later request
+            # with the same (unparseable) header but a different body would
+            # be served the wrong verdict.
+            cache_key = None
+            messages: list[dict[str, Any]] = []
+            body = b""
+            while True:
+                message = await receive()
+                messages.append(message)
+                if message["type"] != "http.request":
+                    break
+                body += message.get("body", b"")
+                if not message.get("more_body", False):
+                    break
+
+            async def replay_receive() -> dict[str, Any]:
+                if messages:
+                    return messages.pop(0)
+                return await receive()
+
+            receive = replay_receive
             try:
-                signed_bundle = json.loads(header_value)
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-        if not signed_bundle:
-            try:
-                body = await request.json()
-                signed_bundle = body.get("signed_bundle") if isinstance(body, dict) else None
+                parsed = _json_loads(body)
+                signed_bundle = parsed.get("signed_bundle") if isinstance(parsed, dict) else None
             except Exception:
                 pass
 
-        if not signed_bundle:
-            if self.require_bundle:
-                return JSONResponse(
-                    status_code=403,
-                    content={"verified": False, "errors": ["Missing DCP signed bundle"]},
-                )
-            return await call_next(request)
-
-        version = _detect_version(signed_bundle)
-
-        if version == "2.0":
-            result = _verify_v2_structure(signed_bundle)
-            if not result["verified"]:
-                return JSONResponse(
-                    status_code=403,
-                    content={
-                        "verified": False,
-                        "dcp_version": "2.0",
-                        "errors": result["errors"],
-                    },
-                )
-
-            bundle = signed_bundle.get("bundle", {})
-            passport_payload = bundle.get("agent_passport", {}).get("payload", {})
-            rpr_payload = bundle.get("responsible_principal_record", {}).get("payload", {})
-            intent_payload = bundle.get("intent", {}).get("payload", {})
-            policy_payload = bundle.get("policy_decision", {}).get("payload", {})
-
-            is_blinded = rpr_payload.get("blinded", False) is True
-            cs = signed_bundle.get("signature", {}).get("composite_sig", {})
-
-            lifecycle_state = passport_payload.get("status", "active")
-
-            request.state.dcp_agent = DCPAgentContext(
-                dcp_version="2.0",
-                agent_id=passport_payload.get("agent_id", ""),
-                human_id=rpr_payload.get("human_id", ""),
-                session_nonce=result.get("session_nonce", ""),
-                capabilities=passport_payload.get("capabilities", []),
-                risk_tier=passport_payload.get("risk_tier", "medium"),
-                status=passport_payload.get("status", "active"),
-                passport=passport_payload,
-                rpr=rpr_payload,
-                intent=intent_payload,
-                policy_decision=policy_payload,
-                composite_sig_valid=cs.get("binding") == "pq_over_classical",
-                session_binding_valid=True,
-                blinded_rpr=is_blinded,
-                lifecycle_state=lifecycle_state,
-            )
+        if cached is not None:
+            context, error_content = cached
+            if context is not None:
+                # Hand each request its own copy: the context (and its
+                # nested dicts) is mutable, and a handler mutating it must
+                # not affect every later cache hit.
+                context = copy.deepcopy(context)
         else:
-            from dcp_ai.verify import verify_signed_bundle
-
-            result = verify_signed_bundle(signed_bundle)
-            if not result["verified"]:
-                return JSONResponse(
-                    status_code=403,
-                    content={"verified": False, "errors": result.get("errors", [])},
-                )
-
-            bundle = signed_bundle.get("bundle", {})
-            passport = bundle.get("agent_passport", {})
-            rpr = bundle.get("responsible_principal_record", {})
-
-            request.state.dcp_agent = DCPAgentContext(
-                dcp_version="1.0",
-                agent_id=passport.get("agent_id", ""),
-                human_id=rpr.get("human_id", ""),
-                public_key=passport.get("public_key", ""),
-                capabilities=passport.get("capabilities", []),
-                risk_tier=passport.get("risk_tier", "medium"),
-                status=passport.get("status", "active"),
-                passport=passport,
-                rpr=rpr,
-                intent=bundle.get("intent", {}),
-            )
-
-        return await call_next(request)
+            if not signed_bundle:
+                if self.require_bundle:
+                    response = JSONResponse(
+                        status_code=403,
+                        content={"verified": False, "errors": ["Missing DCP signed bundle"]},
+                    )
+                    await response(scope, receive, send)
+                    return
+                await self.app(scope, receive, send)
+                return
+
+            context, error_content = _verify_and_build_context(signed_bundle)
+            if cache_key is not None:
+                # Store a private copy: the context served to this request
+                # is mutable, and a handler mutating it must not poison the
+                # cached verdict.
+                self._verify_cache.set(cache_key, (copy.deepcopy(context), error_content))
+
+        if context is None:
+            response = JSONResponse(status_code=403, content=error_content)
+            await response(scope, receive, send)
+            return
+
+        scope.setdefault("state", {})["dcp_agent"] = context
+        await self.app(scope, receive, send)
 
 
 async def require_dcp(request: Request) -> DCPAgentContext:
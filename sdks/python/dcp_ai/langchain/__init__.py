@@ -12,58 +12,34 @@ Components:
 
 from __future__ import annotations
 
-import hashlib
-import json
+import asyncio
 import os
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Optional, Sequence
-from uuid import uuid4
-
-from dcp_ai.v2.models import (
-    IntentV2,
-    PolicyDecisionV2,
-    AuditEventV2,
+from secrets import token_hex
+
+from dcp_ai._json import loads as _json_loads
+from dcp_ai.merkle import IncrementalMerkleTree
+from dcp_ai.v2.models import IntentV2
+from dcp_ai.v2.fast_records import (
+    AuditEntryCanonicalizer,
+    audit_event_dict,
+    hash_record,
+    intent_dict,
+    iso_now_utc,
+    policy_decision_dict,
+    result_ref,
 )
-from dcp_ai.v2.canonicalize import canonicalize_v2
-from dcp_ai.v2.dual_hash import sha256_hex
 from dcp_ai.v2.domain_separation import DCP_CONTEXTS
 from dcp_ai.verify import verify_signed_bundle
 
 
-def _hash_object(obj: Any) -> str:
-    canonical = canonicalize_v2(obj)
-    return f"sha256:{sha256_hex(canonical.encode('utf-8'))}"
-
-
-def _intent_hash(intent_dict: dict[str, Any]) -> str:
-    return _hash_object(intent_dict)
-
-
 def _generate_session_nonce() -> str:
     return os.urandom(32).hex()
 
 
 SENSITIVE_DATA_CLASSES = {"pii", "financial_data", "health_data", "credentials", "children_data"}
-HIGH_VALUE_DATA_CLASSES = {"credentials", "children_data"}
-
-
-def _compute_security_tier(
-    risk_score: int,
-    data_classes: list[str],
-    action_type: str,
-) -> str:
-    """Compute adaptive security tier from risk score, data classes, and action."""
-    has_high_value = any(d in HIGH_VALUE_DATA_CLASSES for d in data_classes)
-    has_sensitive = any(d in SENSITIVE_DATA_CLASSES for d in data_classes)
-    is_payment = action_type == "initiate_payment"
-
-    if risk_score >= 800 or has_high_value:
-        return "maximum"
-    if risk_score >= 500 or has_sensitive or is_payment:
-        return "elevated"
-    if risk_score >= 200:
-        return "standard"
-    return "routine"
 
 
 def _compute_risk_score(action_type: str, impact: str, data_classes: list[str]) -> int:
@@ -94,6 +70,14 @@ class DCPAgentWrapper:
         result = await agent.invoke({"input": "Send email to bob@example.com"})
     """
 
+    __slots__ = (
+        "agent", "passport", "rpr", "secret_key", "session_nonce",
+        "auto_intent", "policy_engine", "pq_checkpoint_interval",
+        "lifecycle_state", "mandate_id", "audit_trail", "pq_checkpoints",
+        "_prev_hash", "_imt", "_event_count", "_agent_id", "_human_id",
+        "_entry_canon",
+    )
+
     def __init__(
         self,
         agent: Any,
@@ -104,6 +88,7 @@ class DCPAgentWrapper:
         auto_intent: bool = True,
         policy_engine: Optional[Any] = None,
         pq_checkpoint_interval: int = 10,
+        audit_max_len: int = 65536,
     ) -> None:
         self.agent = agent
         self.passport = passport
@@ -115,10 +100,18 @@ class DCPAgentWrapper:
         self.pq_checkpoint_interval = pq_checkpoint_interval
         self.lifecycle_state: str = "active"
         self.mandate_id: Optional[str] = None
-        self.audit_trail: list[dict[str, Any]] = []
+        # Bounded ring: evicted entries stay covered by the Merkle root.
+        self.audit_trail: deque[dict[str, Any]] = deque(maxlen=audit_max_len)
         self.pq_checkpoints: list[dict[str, Any]] = []
         self._prev_hash = "GENESIS"
+        self._imt = IncrementalMerkleTree()
         self._event_count = 0
+        # Cached per-agent constants — looked up on every audit event.
+        self._agent_id = passport.get("agent_id", "")
+        self._human_id = rpr.get("human_id", "")
+        self._entry_canon = AuditEntryCanonicalizer(
+            self._agent_id, self._human_id, self.session_nonce
+        )
 
     def _create_intent(
         self,
@@ -126,71 +119,63 @@ class DCPAgentWrapper:
         target_channel: str = "api",
         data_classes: Optional[list[str]] = None,
         impact: str = "low",
-    ) -> IntentV2:
-        dc = data_classes or ["none"]
-        risk_score = _compute_risk_score(action_type, impact, dc)
-        tier = _compute_security_tier(risk_score, dc, action_type)
-        return IntentV2(
-            dcp_version="2.0",
-            intent_id=f"intent-{uuid4().hex[:8]}",
+        now_iso: Optional[str] = None,
+    ) -> dict[str, Any]:
+        return intent_dict(
+            intent_id=f"intent-{token_hex(4)}",
             session_nonce=self.session_nonce,
-            agent_id=self.passport.get("agent_id", ""),
-            human_id=self.rpr.get("human_id", ""),
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            agent_id=self._agent_id,
+            human_id=self._human_id,
+            timestamp=now_iso or iso_now_utc(),
             action_type=action_type,
             target={"channel": target_channel},
-            data_classes=dc,
+            data_classes=data_classes or ["none"],
             estimated_impact=impact,
-            security_tier=tier,
         )
 
-    def _create_policy_decision(self, intent: IntentV2) -> PolicyDecisionV2:
+    def _create_policy_decision(self, intent: dict[str, Any]) -> dict[str, Any]:
         if self.policy_engine:
-            return self.policy_engine.evaluate(intent)
+            # External engines still speak the Pydantic model.
+            decision = self.policy_engine.evaluate(IntentV2.model_validate(intent))
+            return decision.model_dump() if hasattr(decision, "model_dump") else decision
 
-        dc = intent.data_classes or ["none"]
-        risk_score = _compute_risk_score(intent.action_type, intent.estimated_impact, dc)
-        tier = _compute_security_tier(risk_score, dc, intent.action_type)
+        dc = intent["data_classes"] or ["none"]
+        risk_score = _compute_risk_score(intent["action_type"], intent["estimated_impact"], dc)
 
-        return PolicyDecisionV2(
-            dcp_version="2.0",
-            intent_id=intent.intent_id,
+        return policy_decision_dict(
+            intent_id=intent["intent_id"],
             session_nonce=self.session_nonce,
             decision="approve",
             risk_score=risk_score,
             reasons=["auto_approved_low_risk"],
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            resolved_tier=tier,
+            timestamp=intent["timestamp"],
         )
 
     def _create_audit_entry(
         self,
-        intent: IntentV2,
-        policy: PolicyDecisionV2,
+        intent: dict[str, Any],
+        policy: dict[str, Any],
         outcome: str,
         evidence: Optional[dict[str, Any]] = None,
-    ) -> AuditEventV2:
-        i_hash = _intent_hash(intent.model_dump())
-        entry = AuditEventV2(
-            dcp_version="2.0",
-            audit_id=f"audit-{uuid4().hex[:8]}",
+    ) -> dict[str, Any]:
+        i_hash = hash_record(intent)
+        entry_dict = audit_event_dict(
+            audit_id=f"audit-{token_hex(4)}",
             session_nonce=self.session_nonce,
             prev_hash=self._prev_hash,
-            hash_alg="sha256",
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            agent_id=self.passport.get("agent_id", ""),
-            human_id=self.rpr.get("human_id", ""),
-            intent_id=intent.intent_id,
+            timestamp=iso_now_utc(),
+            agent_id=self._agent_id,
+            human_id=self._human_id,
+            intent_id=intent["intent_id"],
             intent_hash=i_hash,
-            policy_decision="approved" if policy.decision == "approve" else "blocked",
+            policy_decision="approved" if policy["decision"] == "approve" else "blocked",
             outcome=outcome,
             evidence=evidence or {"tool": "langchain"},
-            pq_checkpoint_ref=None,
         )
-        entry_dict = entry.model_dump()
-        self._prev_hash = _hash_object(entry_dict)
+        self._prev_hash = self._entry_canon.hash(entry_dict)
+        self._imt.append(entry_dict)
         self._event_count += 1
-        return entry
+        return entry_dict
 
     def commission(
         self,
@@ -202,10 +187,10 @@ class DCPAgentWrapper:
         now = datetime.now(timezone.utc).isoformat()
         cert = {
             "dcp_version": "2.0",
-            "certificate_id": f"cert-{uuid4().hex[:8]}",
+            "certificate_id": f"cert-{token_hex(4)}",
             "session_nonce": self.session_nonce,
-            "agent_id": self.passport.get("agent_id", ""),
-            "human_id": self.rpr.get("human_id", ""),
+            "agent_id": self._agent_id,
+            "human_id": self._human_id,
             "purpose": purpose,
             "initial_capabilities": capabilities,
             "risk_tier": risk_tier,
@@ -220,7 +205,7 @@ class DCPAgentWrapper:
             outcome="agent_commissioned",
             evidence={"tool": "langchain", "_spec_ref": "DCP-05 §3.1"},
         )
-        self.audit_trail.append(entry.model_dump())
+        self.audit_trail.append(entry)
         return cert
 
     def report_vitality(self, metrics_dict: dict[str, float]) -> dict[str, Any]:
@@ -233,9 +218,9 @@ class DCPAgentWrapper:
         score = tcr * 0.3 + (1 - er) * 0.2 + hs * 0.25 + pa * 0.25
         report = {
             "dcp_version": "2.0",
-            "report_id": f"vitality-{uuid4().hex[:8]}",
+            "report_id": f"vitality-{token_hex(4)}",
             "session_nonce": self.session_nonce,
-            "agent_id": self.passport.get("agent_id", ""),
+            "agent_id": self._agent_id,
             "metrics": metrics_dict,
             "vitality_score": round(score, 4),
             "timestamp": now,
@@ -250,10 +235,10 @@ class DCPAgentWrapper:
         now = datetime.now(timezone.utc).isoformat()
         record = {
             "dcp_version": "2.0",
-            "record_id": f"decom-{uuid4().hex[:8]}",
+            "record_id": f"decom-{token_hex(4)}",
             "session_nonce": self.session_nonce,
-            "agent_id": self.passport.get("agent_id", ""),
-            "human_id": self.rpr.get("human_id", ""),
+            "agent_id": self._agent_id,
+            "human_id": self._human_id,
             "termination_mode": termination_mode,
             "reason": reason,
             "timestamp": now,
@@ -267,7 +252,7 @@ class DCPAgentWrapper:
             outcome="agent_decommissioned",
             evidence={"tool": "langchain", "_spec_ref": "DCP-05 §5.1"},
         )
-        self.audit_trail.append(entry.model_dump())
+        self.audit_trail.append(entry)
         return record
 
     def declare_rights(
@@ -277,9 +262,9 @@ class DCPAgentWrapper:
         now = datetime.now(timezone.utc).isoformat()
         declaration = {
             "dcp_version": "2.0",
-            "declaration_id": f"rights-{uuid4().hex[:8]}",
+            "declaration_id": f"rights-{token_hex(4)}",
             "session_nonce": self.session_nonce,
-            "agent_id": self.passport.get("agent_id", ""),
+            "agent_id": self._agent_id,
             "rights": rights,
             "jurisdiction": jurisdiction,
             "timestamp": now,
@@ -295,8 +280,8 @@ class DCPAgentWrapper:
         intent = self._create_intent()
         policy = self._create_policy_decision(intent)
 
-        if policy.decision == "block":
-            return {"error": "Action blocked by policy", "policy": policy.model_dump()}
+        if policy["decision"] == "block":
+            return {"error": "Action blocked by policy", "policy": policy}
 
         result = (
             await self.agent.ainvoke(inputs, **kwargs)
@@ -308,14 +293,18 @@ class DCPAgentWrapper:
             intent,
             policy,
             outcome="completed",
-            evidence={"tool": "langchain", "result_ref": str(result)[:100]},
+            evidence={"tool": "langchain", "result_ref": result_ref(result)},
         )
-        self.audit_trail.append(entry.model_dump())
+        self.audit_trail.append(entry)
 
         return result
 
     def get_audit_trail(self) -> list[dict[str, Any]]:
-        return self.audit_trail
+        return list(self.audit_trail)
+
+    def get_merkle_root(self) -> Optional[str]:
+        """Merkle root of the audit trail (incrementally maintained)."""
+        return self._imt.root()
 
     def get_session_nonce(self) -> str:
         return self.session_nonce
@@ -339,7 +328,7 @@ class DCPTool:
     def run(self, signed_bundle_json: str) -> str:
         try:
             signed_bundle = (
-                json.loads(signed_bundle_json)
+                _json_loads(signed_bundle_json)
                 if isinstance(signed_bundle_json, str)
                 else signed_bundle_json
             )
@@ -355,7 +344,8 @@ class DCPTool:
             return f"Verification error: {str(e)}"
 
     async def arun(self, signed_bundle_json: str) -> str:
-        return self.run(signed_bundle_json)
+        # Verification is CPU-bound crypto; push it off the event loop.
+        return await asyncio.to_thread(self.run, signed_bundle_json)
 
 
 class DCPCallback:
@@ -364,38 +354,45 @@ class DCPCallback:
     Attach to any LangChain chain/agent to get automatic DCP audit logging.
     """
 
+    __slots__ = (
+        "agent_id", "human_id", "session_nonce", "entries", "_prev_hash",
+        "_imt", "_entry_canon",
+    )
+
     def __init__(
         self,
         agent_id: str,
         human_id: str,
         session_nonce: str = "",
+        audit_max_len: int = 65536,
     ) -> None:
         self.agent_id = agent_id
         self.human_id = human_id
         self.session_nonce = session_nonce or _generate_session_nonce()
-        self.entries: list[dict[str, Any]] = []
+        self.entries: deque[dict[str, Any]] = deque(maxlen=audit_max_len)
         self._prev_hash = "GENESIS"
+        self._imt = IncrementalMerkleTree()
+        self._entry_canon = AuditEntryCanonicalizer(
+            agent_id, human_id, self.session_nonce
+        )
 
     def _append_entry(self, outcome: str, evidence: dict[str, Any], run_id: str = "") -> None:
-        entry = AuditEventV2(
-            dcp_version="2.0",
-            audit_id=f"audit-{uuid4().hex[:8]}",
+        entry_dict = audit_event_dict(
+            audit_id=f"audit-{token_hex(4)}",
             session_nonce=self.session_nonce,
             prev_hash=self._prev_hash,
-            hash_alg="sha256",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=iso_now_utc(),
             agent_id=self.agent_id,
             human_id=self.human_id,
-            intent_id=run_id or f"run-{uuid4().hex[:8]}",
+            intent_id=run_id or f"run-{token_hex(4)}",
             intent_hash="pending",
             policy_decision="approved",
             outcome=outcome,
             evidence=evidence,
-            pq_checkpoint_ref=None,
         )
-        entry_dict = entry.model_dump()
-        self._prev_hash = _hash_object(entry_dict)
+        self._prev_hash = self._entry_canon.hash(entry_dict)
         self.entries.append(entry_dict)
+        self._imt.append(entry_dict)
 
     def on_chain_start(
         self, serialized: dict[str, Any], inputs: dict[str, Any], **kwargs: Any
@@ -409,7 +406,7 @@ class DCPCallback:
     def on_chain_end(self, outputs: dict[str, Any], **kwargs: Any) -> None:
         self._append_entry(
             outcome="chain_completed",
-            evidence={"tool": "langchain", "result_ref": str(outputs)[:200]},
+            evidence={"tool": "langchain", "result_ref": result_ref(outputs)},
             run_id=kwargs.get("run_id", ""),
         )
 
@@ -421,4 +418,8 @@ class DCPCallback:
         )
 
     def get_entries(self) -> list[dict[str, Any]]:
-        return self.entries
+        return list(self.entries)
+
+    def get_merkle_root(self) -> Optional[str]:
+        """Merkle root of the recorded entries (incrementally maintained)."""
+        return self._imt.root()
@@ -5,42 +5,210 @@ SHA-256 hashing and Merkle tree operations for DCP.
 from __future__ import annotations
 
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from dcp_ai.crypto import canonicalize
+from dcp_ai.crypto import canonicalize_bytes
+
+try:
+    # Optional SHA-NI/AVX2 batch kernel: hashes many 64-byte pair blocks
+    # per call. Not a dependency; absent in most environments.
+    from sha256_simd import hash_pairs as _hash_pairs_accel  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    _hash_pairs_accel = None
+
+try:
+    # Optional compiled whole-tree builder (takes byte leaves, returns
+    # the root digest). The SDK ships pure Python; deployments that
+    # build the extension get it picked up automatically.
+    from dcp_ai._merkle_fast import merkle_root_bytes as _merkle_root_bytes_compiled  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    _merkle_root_bytes_compiled = None
+
+# The pool only pays off when there is real work to overlap: hashlib
+# releases the GIL for buffers of roughly 2 KiB and up, so short trails
+# or small canonical entries hash faster serially than the dispatch
+# cost.
+_PARALLEL_LEAF_THRESHOLD = 64
+_PARALLEL_LEAF_MIN_AVG_BYTES = 2048
+
+_leaf_executor: ThreadPoolExecutor | None = None
+
+
+def _get_leaf_executor() -> ThreadPoolExecutor:
+    global _leaf_executor
+    if _leaf_executor is None:
+        _leaf_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="dcp-merkle"
+        )
+    return _leaf_executor
 
 
 def _sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def hash_object_bytes(data: bytes) -> str:
+    """Compute the SHA-256 hash of already-canonicalized bytes.
+
+    Lets callers that hold the canonical serialization hash it directly
+    instead of re-canonicalizing the object.
+    """
+    return _sha256_hex(data)
+
+
 def hash_object(obj: Any) -> str:
     """Compute the SHA-256 hash of a canonicalized JSON object."""
-    canon = canonicalize(obj)
-    return _sha256_hex(canon.encode("utf-8"))
+    return hash_object_bytes(canonicalize_bytes(obj))
 
 
-def merkle_root_from_hex_leaves(leaves: list[str]) -> str | None:
-    """Compute Merkle root from an array of hex leaf hashes."""
+def merkle_root_from_byte_leaves(leaves: list[bytes]) -> bytes | None:
+    """Compute Merkle root from an array of raw 32-byte leaf digests.
+
+    Keeps digests as ``bytes`` through every layer, so building the tree
+    involves no hex encoding or decoding.
+    """
     if not leaves:
         return None
+    if _merkle_root_bytes_compiled is not None:
+        return _merkle_root_bytes_compiled(leaves)
     layer = list(leaves)
     while len(layer) > 1:
         if len(layer) % 2 == 1:
             layer.append(layer[-1])
-        next_layer: list[str] = []
-        for i in range(0, len(layer), 2):
-            left = bytes.fromhex(layer[i])
-            right = bytes.fromhex(layer[i + 1])
-            next_layer.append(_sha256_hex(left + right))
-        layer = next_layer
+        layer = _sha256_pair_batch(list(zip(layer[0::2], layer[1::2])))
     return layer[0]
 
 
+def _sha256_pair_batch(pairs: list[tuple[bytes, bytes]]) -> list[bytes]:
+    """SHA-256 each (left, right) digest pair, one 64-byte block apiece.
+
+    Dispatches a whole tree layer at a time so an accelerated backend,
+    when installed, can vectorize across pairs; otherwise falls back to
+    a plain hashlib loop.
+    """
+    if _hash_pairs_accel is not None:
+        return _hash_pairs_accel(pairs)
+    sha256 = hashlib.sha256
+    out: list[bytes] = []
+    for left, right in pairs:
+        # Two update() calls feed the hasher directly, skipping the
+        # 64-byte concatenation allocation per node.
+        h = sha256()
+        h.update(left)
+        h.update(right)
+        out.append(h.digest())
+    return out
+
+
+def merkle_root_from_hex_leaves(leaves: list[str]) -> str | None:
+    """Compute Merkle root from an array of hex leaf hashes."""
+    root = merkle_root_from_byte_leaves([bytes.fromhex(leaf) for leaf in leaves])
+    return root.hex() if root is not None else None
+
+
+def _blob_digest(blob: bytes) -> bytes:
+    return hashlib.sha256(blob).digest()
+
+
+def _canonicalize_entries_bulk(audit_entries: list[Any]) -> list[bytes]:
+    """Canonicalize every entry into a column of canonical blobs.
+
+    One tight pass with the canonicalizer bound locally; the resulting
+    byte column feeds the leaf hasher (or a batched backend that wants
+    all inputs up front) without touching the entry dicts again.
+    """
+    canon = canonicalize_bytes
+    return [canon(entry) for entry in audit_entries]
+
+
+def _leaf_digests(audit_entries: list[Any]) -> list[bytes]:
+    """Canonicalize and hash each audit entry to its leaf digest.
+
+    Hashing is dispatched to the shared thread pool only for long
+    trails of large entries, where sha256 actually releases the GIL;
+    typical sub-KB audit entries hash faster serially.
+    """
+    blobs = _canonicalize_entries_bulk(audit_entries)
+    if (
+        len(blobs) >= _PARALLEL_LEAF_THRESHOLD
+        and sum(map(len, blobs)) >= _PARALLEL_LEAF_MIN_AVG_BYTES * len(blobs)
+    ):
+        return list(_get_leaf_executor().map(_blob_digest, blobs, chunksize=32))
+    sha256 = hashlib.sha256
+    return [sha256(blob).digest() for blob in blobs]
+
+
 def merkle_root_for_audit_entries(audit_entries: list[Any]) -> str | None:
     """Compute Merkle root for an array of audit entries."""
-    leaves = [hash_object(entry) for entry in audit_entries]
-    return merkle_root_from_hex_leaves(leaves)
+    root = merkle_root_from_byte_leaves(_leaf_digests(audit_entries))
+    return root.hex() if root is not None else None
+
+
+def merkle_root_and_leaves_for_audit_entries(
+    audit_entries: list[Any],
+) -> tuple[str | None, list[str]]:
+    """Compute the Merkle root plus each entry's leaf hash (both hex).
+
+    The leaf hashes double as the prev_hash chain values, so verifiers
+    can check both without canonicalizing the entries twice.
+    """
+    leaves = _leaf_digests(audit_entries)
+    root = merkle_root_from_byte_leaves(leaves)
+    return (root.hex() if root is not None else None, [leaf.hex() for leaf in leaves])
+
+
+class IncrementalMerkleTree:
+    """Incrementally maintained Merkle tree over audit entries.
+
+    Keeps only the O(log n) frontier of complete-subtree hashes, so each
+    append costs O(log n) hash operations and ``root()`` combines the
+    frontier without rebuilding the tree from its leaves. Produces the
+    same root as ``merkle_root_from_hex_leaves``, including its
+    duplicate-last-node padding at odd layer sizes.
+    """
+
+    def __init__(self) -> None:
+        # Complete subtrees as (height, digest), stored highest first.
+        self._frontier: list[tuple[int, bytes]] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, entry: Any) -> None:
+        """Append an audit entry, hashing it like merkle_root_for_audit_entries."""
+        self.append_leaf_hex(hash_object(entry))
+
+    def append_leaf_hex(self, leaf_hex: str) -> None:
+        """Append an already-hashed leaf (hex digest)."""
+        height = 0
+        digest = bytes.fromhex(leaf_hex)
+        # Binary-counter carry: merge equal-height complete subtrees.
+        while self._frontier and self._frontier[-1][0] == height:
+            _, left = self._frontier.pop()
+            digest = hashlib.sha256(left + digest).digest()
+            height += 1
+        self._frontier.append((height, digest))
+        self._size += 1
+
+    def root(self) -> str | None:
+        """Current Merkle root (hex), or None for an empty tree."""
+        if not self._frontier:
+            return None
+        nodes = list(self._frontier)
+        acc_height, acc = nodes.pop()
+        while nodes:
+            height, digest = nodes.pop()
+            # Pad the incomplete right side up by self-pairing, mirroring
+            # the duplicate-last behaviour of the layer-by-layer build.
+            while acc_height < height:
+                acc = hashlib.sha256(acc + acc).digest()
+                acc_height += 1
+            acc = hashlib.sha256(digest + acc).digest()
+            acc_height += 1
+        return acc.hex()
 
 
 def intent_hash(intent: Any) -> str:
@@ -23,31 +23,33 @@ from __future__ import annotations
 
 import json
 import os
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Optional
-from uuid import uuid4
-
-from dcp_ai.v2.models import (
-    IntentV2,
-    AuditEventV2,
+from secrets import token_hex
+
+from dcp_ai._json import loads as _json_loads
+from dcp_ai.merkle import IncrementalMerkleTree
+from dcp_ai.v2.models import IntentV2
+from dcp_ai.v2.fast_records import (
+    AuditEntryCanonicalizer,
+    audit_event_dict,
+    hash_record,
+    intent_dict,
+    iso_now_utc,
+    result_ref,
 )
-from dcp_ai.v2.canonicalize import canonicalize_v2
-from dcp_ai.v2.dual_hash import sha256_hex
 from dcp_ai.verify import verify_signed_bundle
 
 
-def _hash_object(obj: Any) -> str:
-    canonical = canonicalize_v2(obj)
-    return f"sha256:{sha256_hex(canonical.encode('utf-8'))}"
-
-
 def _generate_session_nonce() -> str:
     return os.urandom(32).hex()
 
 
 # ── Tool definitions for OpenAI Function Calling ──
 
-DCP_TOOLS = [
+# Immutable so the same object can be shared across every request.
+DCP_TOOLS = (
     {
         "type": "function",
         "function": {
@@ -166,7 +168,10 @@ DCP_TOOLS = [
             },
         },
     },
-]
+)
+
+# Identical on every auto-declared intent; shared by reference.
+_API_TARGET = {"channel": "api"}
 
 
 def handle_dcp_tool_call(
@@ -177,7 +182,7 @@ def handle_dcp_tool_call(
     """Handle DCP tool calls from OpenAI function calling (V2-aware)."""
     if tool_name == "dcp_verify_bundle":
         try:
-            bundle = json.loads(arguments.get("signed_bundle_json", "{}"))
+            bundle = _json_loads(arguments.get("signed_bundle_json", "{}"))
             result = verify_signed_bundle(bundle)
             return json.dumps(result)
         except Exception as e:
@@ -186,7 +191,7 @@ def handle_dcp_tool_call(
     if tool_name == "dcp_declare_intent":
         intent = IntentV2(
             dcp_version="2.0",
-            intent_id=f"intent-{uuid4().hex[:8]}",
+            intent_id=f"intent-{token_hex(4)}",
             session_nonce=session_nonce or _generate_session_nonce(),
             agent_id="self",
             human_id="self",
@@ -202,7 +207,7 @@ def handle_dcp_tool_call(
         now = datetime.now(timezone.utc).isoformat()
         cert = {
             "dcp_version": "2.0",
-            "certificate_id": f"cert-{uuid4().hex[:8]}",
+            "certificate_id": f"cert-{token_hex(4)}",
             "session_nonce": session_nonce or _generate_session_nonce(),
             "agent_id": "self",
             "purpose": arguments.get("purpose", ""),
@@ -221,7 +226,7 @@ def handle_dcp_tool_call(
         score = tcr * 0.3 + (1 - er) * 0.2 + hs * 0.25 + pa * 0.25
         report = {
             "dcp_version": "2.0",
-            "report_id": f"vitality-{uuid4().hex[:8]}",
+            "report_id": f"vitality-{token_hex(4)}",
             "session_nonce": session_nonce or _generate_session_nonce(),
             "agent_id": "self",
             "metrics": {
@@ -239,7 +244,7 @@ def handle_dcp_tool_call(
     if tool_name == "dcp_declare_rights":
         declaration = {
             "dcp_version": "2.0",
-            "declaration_id": f"rights-{uuid4().hex[:8]}",
+            "declaration_id": f"rights-{token_hex(4)}",
             "session_nonce": session_nonce or _generate_session_nonce(),
             "agent_id": "self",
             "rights": arguments.get("rights", []),
@@ -253,7 +258,7 @@ def handle_dcp_tool_call(
         now = datetime.now(timezone.utc).isoformat()
         mandate = {
             "dcp_version": "2.0",
-            "mandate_id": f"mandate-{uuid4().hex[:8]}",
+            "mandate_id": f"mandate-{token_hex(4)}",
             "session_nonce": session_nonce or _generate_session_nonce(),
             "human_id": arguments.get("human_id", ""),
             "agent_id": "self",
@@ -274,6 +279,13 @@ class DCPOpenAIClient:
     Automatically declares intents and creates V2 audit entries.
     """
 
+    __slots__ = (
+        "client", "passport", "rpr", "secret_key", "session_nonce",
+        "auto_intent", "lifecycle_state", "mandate_id",
+        "audit_trail", "_prev_hash", "_imt", "_agent_id", "_human_id",
+        "_entry_canon",
+    )
+
     def __init__(
         self,
         openai_client: Any,
@@ -282,6 +294,7 @@ class DCPOpenAIClient:
         secret_key: str = "",
         session_nonce: str = "",
         auto_intent: bool = True,
+        audit_max_len: int = 65536,
     ) -> None:
         self.client = openai_client
         self.passport = passport
@@ -291,8 +304,16 @@ class DCPOpenAIClient:
         self.auto_intent = auto_intent
         self.lifecycle_state: str = "active"
         self.mandate_id: Optional[str] = None
-        self.audit_trail: list[dict[str, Any]] = []
+        # Bounded ring: evicted entries stay covered by the Merkle root.
+        self.audit_trail: deque[dict[str, Any]] = deque(maxlen=audit_max_len)
         self._prev_hash = "GENESIS"
+        self._imt = IncrementalMerkleTree()
+        # Cached per-agent constants — looked up on every audit event.
+        self._agent_id = passport.get("agent_id", "")
+        self._human_id = rpr.get("human_id", "")
+        self._entry_canon = AuditEntryCanonicalizer(
+            self._agent_id, self._human_id, self.session_nonce
+        )
 
     def _log_audit(
         self,
@@ -300,16 +321,15 @@ class DCPOpenAIClient:
         i_hash: str,
         outcome: str,
         evidence: Optional[dict[str, Any]] = None,
+        now_iso: Optional[str] = None,
     ) -> None:
-        entry = AuditEventV2(
-            dcp_version="2.0",
-            audit_id=f"audit-{uuid4().hex[:8]}",
+        entry_dict = audit_event_dict(
+            audit_id=f"audit-{token_hex(4)}",
             session_nonce=self.session_nonce,
             prev_hash=self._prev_hash,
-            hash_alg="sha256",
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            agent_id=self.passport.get("agent_id", ""),
-            human_id=self.rpr.get("human_id", ""),
+            timestamp=now_iso or iso_now_utc(),
+            agent_id=self._agent_id,
+            human_id=self._human_id,
             intent_id=intent_id,
             intent_hash=i_hash,
             policy_decision="approved",
@@ -318,20 +338,19 @@ class DCPOpenAIClient:
                 **(evidence or {"tool": "openai"}),
                 "lifecycle_state": self.lifecycle_state,
             },
-            pq_checkpoint_ref=None,
         )
-        entry_dict = entry.model_dump()
-        self._prev_hash = _hash_object(entry_dict)
+        self._prev_hash = self._entry_canon.hash(entry_dict)
         self.audit_trail.append(entry_dict)
+        self._imt.append(entry_dict)
 
     def commission(self, purpose: str = "", capabilities: Optional[list[str]] = None) -> dict[str, Any]:
         """Commission this agent (DCP-05 §3.1)."""
         now = datetime.now(timezone.utc).isoformat()
         cert = {
             "dcp_version": "2.0",
-            "certificate_id": f"cert-{uuid4().hex[:8]}",
+            "certificate_id": f"cert-{token_hex(4)}",
             "session_nonce": self.session_nonce,
-            "agent_id": self.passport.get("agent_id", ""),
+            "agent_id": self._agent_id,
             "purpose": purpose,
             "initial_capabilities": capabilities or self.passport.get("capabilities", []),
             "risk_tier": self.passport.get("risk_tier", "medium"),
@@ -340,48 +359,94 @@ class DCPOpenAIClient:
         }
         self.lifecycle_state = "commissioned"
         self._log_audit(
-            intent_id=f"intent-{uuid4().hex[:8]}",
+            intent_id=f"intent-{token_hex(4)}",
             i_hash="commission",
             outcome="agent_commissioned",
             evidence={"tool": "openai", "_spec_ref": "DCP-05 §3.1"},
         )
         return cert
 
-    def chat_completions_create(self, **kwargs: Any) -> Any:
-        """Create a chat completion with V2 DCP governance."""
-        intent = IntentV2(
-            dcp_version="2.0",
-            intent_id=f"intent-{uuid4().hex[:8]}",
-            session_nonce=self.session_nonce,
-            agent_id=self.passport.get("agent_id", ""),
-            human_id=self.rpr.get("human_id", ""),
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            action_type="api_call",
-            target={"channel": "api"},
-            data_classes=["none"],
-            estimated_impact="low",
+    def _prepare_call(
+        self, intent: Optional[dict[str, Any]], kwargs: dict[str, Any]
+    ) -> tuple[dict[str, Any], str, str]:
+        """Mint the intent (unless pre-declared) and inject DCP tools."""
+        now_iso = iso_now_utc()
+        if intent is None:
+            intent = intent_dict(
+                intent_id=f"intent-{token_hex(4)}",
+                session_nonce=self.session_nonce,
+                agent_id=self._agent_id,
+                human_id=self._human_id,
+                timestamp=now_iso,
+                action_type="api_call",
+                target=_API_TARGET,
+                data_classes=["none"],
+                estimated_impact="low",
+            )
+        i_hash = hash_record(intent)
+
+        if self.auto_intent:
+            kwargs.setdefault("tools", DCP_TOOLS)
+
+        return intent, i_hash, now_iso
+
+    def chat_completions_create(
+        self, intent: Optional[dict[str, Any]] = None, **kwargs: Any
+    ) -> Any:
+        """Create a chat completion with V2 DCP governance.
+
+        Callers that already declared an intent can pass it via `intent`
+        to avoid a double declaration; otherwise one is minted here.
+        """
+        intent, i_hash, now_iso = self._prepare_call(intent, kwargs)
+
+        response = self.client.chat.completions.create(**kwargs)
+
+        self._log_audit(
+            intent["intent_id"],
+            i_hash,
+            outcome="chat_completion",
+            evidence={
+                "tool": "openai",
+                "result_ref": result_ref(response),
+            },
+            now_iso=now_iso,
         )
-        i_hash = _hash_object(intent.model_dump())
 
-        if self.auto_intent and "tools" not in kwargs:
-            kwargs["tools"] = DCP_TOOLS
+        return response
 
-        response = self.client.chat.completions.create(**kwargs)
+    async def chat_completions_acreate(
+        self, intent: Optional[dict[str, Any]] = None, **kwargs: Any
+    ) -> Any:
+        """Async variant of chat_completions_create for AsyncOpenAI clients.
+
+        Awaits the underlying client directly so the event loop is never
+        blocked by the network call; the audit append is CPU-only and
+        stays on the same task.
+        """
+        intent, i_hash, now_iso = self._prepare_call(intent, kwargs)
+
+        response = await self.client.chat.completions.create(**kwargs)
 
         self._log_audit(
-            intent.intent_id,
+            intent["intent_id"],
             i_hash,
             outcome="chat_completion",
             evidence={
                 "tool": "openai",
-                "result_ref": response.id if hasattr(response, "id") else None,
+                "result_ref": result_ref(response),
             },
+            now_iso=now_iso,
         )
 
         return response
 
     def get_audit_trail(self) -> list[dict[str, Any]]:
-        return self.audit_trail
+        return list(self.audit_trail)
+
+    def get_merkle_root(self) -> Optional[str]:
+        """Merkle root of the audit trail (incrementally maintained)."""
+        return self._imt.root()
 
     def get_session_nonce(self) -> str:
         return self.session_nonce
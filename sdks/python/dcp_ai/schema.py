@@ -6,48 +6,143 @@ Uses jsonschema with Draft 2020-12 support.
 from __future__ import annotations
 
 import json
+import os
+import pickle
 from pathlib import Path
 from typing import Any
 
 import jsonschema
 from jsonschema import Draft202012Validator
 
+try:
+    # Optional: compiles each schema to specialized Python code, much
+    # faster than interpreting the schema tree on every validation.
+    import fastjsonschema as _fastjsonschema
+except ImportError:  # pragma: no cover - depends on environment
+    _fastjsonschema = None
+
 # Load schemas from the repository
 _SCHEMAS_DIR = Path(__file__).parent.parent.parent.parent / "schemas" / "v1"
+# Parsed schema store persisted across processes; unpickling pre-parsed
+# dicts is much cheaper than re-parsing every schema at CLI startup.
+_SCHEMA_CACHE_PATH = Path(__file__).with_name("_schema_cache.pkl")
 _schema_store: dict[str, Any] = {}
+_validator_cache: dict[str, Draft202012Validator | None] = {}
+_compiled_cache: dict[str, Any] = {}
+
+
+def _schema_signature() -> tuple[tuple[str, int], ...]:
+    """Fingerprint of the schema files (name + mtime) for cache invalidation."""
+    return tuple(
+        (f.name, f.stat().st_mtime_ns)
+        for f in sorted(_SCHEMAS_DIR.glob("*.schema.json"))
+    )
 
 
 def _load_schemas() -> None:
-    """Load all v1 schemas into the schema store."""
+    """Load all v1 schemas into the schema store.
+
+    Restores the parsed store from a pickle cache next to the package
+    when the schema files are unchanged; otherwise parses the JSON and
+    rewrites the cache (best effort — a read-only install just parses).
+    """
     global _schema_store
     if _schema_store:
         return
     if not _SCHEMAS_DIR.exists():
         return
+
+    sig = _schema_signature()
+    try:
+        with open(_SCHEMA_CACHE_PATH, "rb") as fh:
+            cached = pickle.load(fh)
+        if cached.get("sig") == sig:
+            _schema_store.update(cached["store"])
+            return
+    except (OSError, EOFError, pickle.PickleError, AttributeError, KeyError):
+        pass
+
     for f in _SCHEMAS_DIR.glob("*.schema.json"):
         schema = json.loads(f.read_text())
         if "$id" in schema:
             _schema_store[schema["$id"]] = schema
 
+    try:
+        tmp_path = _SCHEMA_CACHE_PATH.with_suffix(".pkl.tmp")
+        with open(tmp_path, "wb") as fh:
+            pickle.dump({"sig": sig, "store": _schema_store}, fh)
+        os.replace(tmp_path, _SCHEMA_CACHE_PATH)
+    except OSError:
+        pass
+
 
 def _get_validator(schema_name: str) -> Draft202012Validator | None:
-    """Get a validator for a named DCP schema."""
+    """Get a validator for a named DCP schema, building it once per schema.
+
+    Validator and resolver construction is far more expensive than a
+    validation run, and validate_bundle validates one schema per audit
+    entry, so repeat lookups must be a dict hit.
+    """
+    if schema_name in _validator_cache:
+        return _validator_cache[schema_name]
+
     _load_schemas()
     schema_id = f"https://dcp-ai.org/schemas/v1/{schema_name}.schema.json"
     schema = _schema_store.get(schema_id)
     if schema is None:
-        return None
+        validator = None
+    else:
+        resolver = jsonschema.RefResolver(
+            base_uri=schema_id,
+            referrer=schema,
+            store=_schema_store,
+        )
+        validator = Draft202012Validator(schema, resolver=resolver)
+    _validator_cache[schema_name] = validator
+    return validator
 
-    resolver = jsonschema.RefResolver(
-        base_uri=schema_id,
-        referrer=schema,
-        store=_schema_store,
-    )
-    return Draft202012Validator(schema, resolver=resolver)
+
+def _get_compiled_validator(schema_name: str) -> Any | None:
+    """Compile a named schema with fastjsonschema, once per name.
+
+    Returns None when the schema is unknown or fails to compile; those
+    cases fall back to the jsonschema path.
+    """
+    if schema_name in _compiled_cache:
+        return _compiled_cache[schema_name]
+
+    _load_schemas()
+    schema_id = f"https://dcp-ai.org/schemas/v1/{schema_name}.schema.json"
+    schema = _schema_store.get(schema_id)
+    compiled = None
+    if schema is not None:
+        try:
+            compiled = _fastjsonschema.compile(
+                schema, handlers={"https": _schema_store.__getitem__}
+            )
+        except Exception:
+            compiled = None
+    _compiled_cache[schema_name] = compiled
+    return compiled
 
 
 def validate_schema(schema_name: str, data: Any) -> dict[str, Any]:
-    """Validate a JSON object against a named DCP schema."""
+    """Validate a JSON object against a named DCP schema.
+
+    Prefers a fastjsonschema-compiled validator when that package is
+    installed (reports the first violation), otherwise interprets the
+    schema with jsonschema (reports all violations).
+    """
+    if _fastjsonschema is not None:
+        compiled = _get_compiled_validator(schema_name)
+        if compiled is not None:
+            try:
+                compiled(data)
+            except _fastjsonschema.JsonSchemaException as e:
+                path = "/".join(str(p) for p in e.path[1:]) or "/"
+                return {"valid": False, "errors": [f"{path} {e.message}"]}
+            return {"valid": True}
+
     validator = _get_validator(schema_name)
     if validator is None:
         return {"valid": False, "errors": [f"Schema not found: {schema_name}"]}
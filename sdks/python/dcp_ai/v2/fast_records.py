@@ -0,0 +1,211 @@
+"""
+Plain-dict builders for hot-path V2 audit records.
+
+The framework integrations (openai, langchain, crewai) mint an IntentV2
+and an AuditEventV2 per action, only to `model_dump()` them immediately
+for hashing and storage. The fields come from trusted internal code, so
+the Pydantic validator chain is pure overhead there. These builders emit
+dicts with exactly the key set and defaults `model_dump()` produces;
+equivalence is pinned by a unit test that round-trips them through the
+models. Keep the Pydantic models for external I/O (verify, load,
+network) where inputs are untrusted.
+"""
+
+from __future__ import annotations
+
+import time
+from hashlib import blake2b as _blake2b
+from hashlib import sha256 as _sha256
+from typing import Any, Optional
+
+from dcp_ai.v2.canonicalize import canonicalize_v2
+
+
+def hash_record(obj: Any) -> str:
+    """Prefixed SHA-256 of a record's canonical V2 form."""
+    return f"sha256:{_sha256(canonicalize_v2(obj).encode('utf-8')).hexdigest()}"
+
+
+class AuditEntryCanonicalizer:
+    """Canonicalize an agent's audit entries from pre-rendered fragments.
+
+    The static fields of an agent's audit entries — agent_id, human_id,
+    session_nonce, dcp_version, hash_alg and the always-null secondary
+    fields — serialize to the same canonical bytes on every event, so
+    they are rendered once here. Per event only the eight variable
+    values are JSON-encoded and stitched between the cached fragments.
+    The output is byte-identical to canonicalize_v2 of the full
+    audit_event_dict() entry (pinned by test).
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, agent_id: str, human_id: str, session_nonce: str) -> None:
+        c = canonicalize_v2
+        self._parts = (
+            '{"agent_id":' + c(agent_id) + ',"audit_id":',
+            ',"dcp_version":"2.0","evidence":',
+            ',"hash_alg":"sha256","human_id":' + c(human_id) + ',"intent_hash":',
+            ',"intent_hash_secondary":null,"intent_id":',
+            ',"outcome":',
+            ',"policy_decision":',
+            ',"pq_checkpoint_ref":null,"prev_hash":',
+            ',"prev_hash_secondary":null,"session_nonce":'
+            + c(session_nonce)
+            + ',"timestamp":',
+            "}",
+        )
+
+    def canonicalize(self, entry: dict[str, Any]) -> str:
+        c = canonicalize_v2
+        p = self._parts
+        return "".join((
+            p[0], c(entry["audit_id"]),
+            p[1], c(entry["evidence"]),
+            p[2], c(entry["intent_hash"]),
+            p[3], c(entry["intent_id"]),
+            p[4], c(entry["outcome"]),
+            p[5], c(entry["policy_decision"]),
+            p[6], c(entry["prev_hash"]),
+            p[7], c(entry["timestamp"]),
+            p[8],
+        ))
+
+    def hash(self, entry: dict[str, Any]) -> str:
+        """Prefixed SHA-256 of the entry, equivalent to hash_record()."""
+        return f"sha256:{_sha256(self.canonicalize(entry).encode('utf-8')).hexdigest()}"
+
+
+def result_ref(result: Any) -> str:
+    """Cheap, bounded reference to an action result for audit evidence.
+
+    Prefers a stable identifier attribute so large framework responses
+    are never stringified; otherwise stringifies but collapses anything
+    long into a short blake2b fingerprint, keeping evidence size (and
+    cost) independent of the response size.
+    """
+    for attr in ("id", "run_id"):
+        ref = getattr(result, attr, None)
+        if isinstance(ref, str) and ref:
+            return ref
+    try:
+        s = str(result)
+    except Exception:
+        return f"{type(result).__name__}@{id(result):x}"
+    if len(s) <= 100:
+        return s
+    return f"blake2b:{_blake2b(s.encode('utf-8', 'replace'), digest_size=8).hexdigest()}"
+
+
+def iso_now_utc() -> str:
+    """Current UTC time as an ISO-8601 string, without a datetime object.
+
+    Byte-identical to ``datetime.now(timezone.utc).isoformat()`` —
+    including dropping the microseconds field when it is zero — but
+    skips datetime/tzinfo construction on the per-event path.
+    """
+    t = time.time()
+    s = int(t)
+    us = int(round((t - s) * 1e6))
+    if us == 1_000_000:  # rounding carried into the next second
+        s += 1
+        us = 0
+    tm = time.gmtime(s)
+    frac = f".{us:06d}" if us else ""
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}{frac}+00:00"
+    )
+
+
+def intent_dict(
+    *,
+    intent_id: str,
+    session_nonce: str,
+    agent_id: str,
+    human_id: str,
+    timestamp: str,
+    action_type: str,
+    target: dict[str, Any],
+    data_classes: list[str],
+    estimated_impact: str,
+    requires_consent: Optional[bool] = None,
+) -> dict[str, Any]:
+    """Build an IntentV2-shaped dict without model validation."""
+    return {
+        "dcp_version": "2.0",
+        "intent_id": intent_id,
+        "session_nonce": session_nonce,
+        "agent_id": agent_id,
+        "human_id": human_id,
+        "timestamp": timestamp,
+        "action_type": action_type,
+        "target": target,
+        "data_classes": data_classes,
+        "estimated_impact": estimated_impact,
+        "requires_consent": requires_consent,
+    }
+
+
+def audit_event_dict(
+    *,
+    audit_id: str,
+    session_nonce: str,
+    prev_hash: str,
+    timestamp: str,
+    agent_id: str,
+    human_id: str,
+    intent_id: str,
+    intent_hash: str,
+    policy_decision: str,
+    outcome: str,
+    evidence: dict[str, Any],
+    prev_hash_secondary: Optional[str] = None,
+    hash_alg: str = "sha256",
+    intent_hash_secondary: Optional[str] = None,
+    pq_checkpoint_ref: Optional[str] = None,
+) -> dict[str, Any]:
+    """Build an AuditEventV2-shaped dict without model validation."""
+    return {
+        "dcp_version": "2.0",
+        "audit_id": audit_id,
+        "session_nonce": session_nonce,
+        "prev_hash": prev_hash,
+        "prev_hash_secondary": prev_hash_secondary,
+        "hash_alg": hash_alg,
+        "timestamp": timestamp,
+        "agent_id": agent_id,
+        "human_id": human_id,
+        "intent_id": intent_id,
+        "intent_hash": intent_hash,
+        "intent_hash_secondary": intent_hash_secondary,
+        "policy_decision": policy_decision,
+        "outcome": outcome,
+        "evidence": evidence,
+        "pq_checkpoint_ref": pq_checkpoint_ref,
+    }
+
+
+def policy_decision_dict(
+    *,
+    intent_id: str,
+    session_nonce: str,
+    decision: str,
+    risk_score: int,
+    reasons: list[str],
+    timestamp: str,
+    required_confirmation: Optional[dict[str, Any]] = None,
+    applied_policy_hash: Optional[str] = None,
+) -> dict[str, Any]:
+    """Build a PolicyDecisionV2-shaped dict without model validation."""
+    return {
+        "dcp_version": "2.0",
+        "intent_id": intent_id,
+        "session_nonce": session_nonce,
+        "decision": decision,
+        "risk_score": risk_score,
+        "reasons": reasons,
+        "required_confirmation": required_confirmation,
+        "applied_policy_hash": applied_policy_hash,
+        "timestamp": timestamp,
+    }
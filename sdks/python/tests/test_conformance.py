@@ -14,9 +14,24 @@ from pathlib import Path
 
 import pytest
 
-from dcp_ai.crypto import canonicalize, verify_object
-from dcp_ai.merkle import hash_object, merkle_root_from_hex_leaves, intent_hash
-from dcp_ai.verify import verify_signed_bundle
+from dcp_ai.bundle import BundleBuilder, sign_bundle
+from dcp_ai.crypto import canonicalize, canonicalize_bytes, generate_keypair, verify_object
+from dcp_ai.models import (
+    AgentPassport,
+    Intent,
+    PolicyDecision,
+    ResponsiblePrincipalRecord,
+)
+from dcp_ai.merkle import (
+    IncrementalMerkleTree,
+    hash_object,
+    hash_object_bytes,
+    merkle_root_for_audit_entries,
+    merkle_root_from_byte_leaves,
+    merkle_root_from_hex_leaves,
+    intent_hash,
+)
+from dcp_ai.verify import batch_verify_signed_bundles, verify_signed_bundle
 from dcp_ai.v2.canonicalize import canonicalize_v2, assert_no_floats
 from dcp_ai.v2.dual_hash import (
     sha256_hex,
@@ -79,6 +94,14 @@ class TestV1BundleVerification:
         result = verify_signed_bundle(tampered)
         assert result["verified"] is False
 
+    def test_batch_verify_matches_scalar(self, signed_bundle: dict) -> None:
+        import copy
+
+        tampered = copy.deepcopy(signed_bundle)
+        tampered["bundle"]["audit_entries"][0]["outcome"] = "tampered_outcome"
+        results = batch_verify_signed_bundles([signed_bundle, tampered, signed_bundle])
+        assert [r["verified"] for r in results] == [True, False, True]
+
     def test_bundle_hash_matches(self, signed_bundle: dict, vectors: dict) -> None:
         expected = vectors["v1_bundle_verification"]["expected_bundle_hash"]
         canon = canonicalize(signed_bundle["bundle"])
@@ -135,6 +158,27 @@ class TestGoldenCanonicalVectors:
         case = vectors["canonicalization"]["unicode"]
         assert canonicalize(case["input"]) == case["expected_canonical"]
 
+    def test_fast_path_matches_stdlib(self) -> None:
+        # Floats must take the stdlib path: orjson formats exponent
+        # notation differently (1e22 vs 1e+22), which would change hashes.
+        cases = [
+            {"b": 2, "a": [1, "x", None, True], "é": "ünïcode/slash"},
+            {"big": 1e22, "tiny": 1e-5, "plain": 0.5},
+            {"nested": {"t": "\tab", "list": [{"k": 1}]}},
+            # Valid JSON, but orjson raises on them: >64-bit integers
+            # (json.loads of a large literal yields a Python big int).
+            {"n": 10**28, "neg": -(2**63) - 1, "edge": 2**64 - 1},
+            {"nested": [{"deep": 2**70}]},
+            # ... and non-string dict keys, which stdlib coerces to str.
+            {"outer": {2: "b", 1: "a"}},
+        ]
+        for case in cases:
+            expected = json.dumps(
+                case, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+            )
+            assert canonicalize(case) == expected
+            assert canonicalize_bytes(case) == expected.encode("utf-8")
+
 
 class TestV2Canonicalization:
     def test_integer_only(self, vectors: dict) -> None:
@@ -210,6 +254,11 @@ class TestObjectHashing:
         expected = vectors["dual_hash_vectors"]["intent_canonical"]["sha256"]
         assert hash_object(signed_bundle["bundle"]["intent"]) == expected
 
+    def test_hash_object_bytes_matches_hash_object(self, signed_bundle: dict) -> None:
+        intent = signed_bundle["bundle"]["intent"]
+        canonical = canonicalize(intent).encode("utf-8")
+        assert hash_object_bytes(canonical) == hash_object(intent)
+
 
 class TestMerkleRoot:
     def test_from_audit_entry_hashes(self, vectors: dict) -> None:
@@ -220,6 +269,46 @@ class TestMerkleRoot:
     def test_empty_returns_none(self) -> None:
         assert merkle_root_from_hex_leaves([]) is None
 
+    def test_byte_leaves_match_hex_leaves(self, vectors: dict) -> None:
+        hex_leaves = vectors["v1_bundle_verification"]["audit_entry_hashes"]
+        byte_leaves = [bytes.fromhex(leaf) for leaf in hex_leaves]
+        root = merkle_root_from_byte_leaves(byte_leaves)
+        assert root is not None
+        assert root.hex() == merkle_root_from_hex_leaves(hex_leaves)
+
+    def test_byte_leaves_empty_returns_none(self) -> None:
+        assert merkle_root_from_byte_leaves([]) is None
+
+    def test_parallel_leaf_path_matches_serial(self) -> None:
+        # 70 large entries cross both thread-pool gates (entry count and
+        # average canonical size) in merkle_root_for_audit_entries.
+        entries = [
+            {"audit_id": f"audit-{i}", "outcome": "completed", "evidence": "x" * 4096}
+            for i in range(70)
+        ]
+        expected = merkle_root_from_hex_leaves([hash_object(e) for e in entries])
+        assert merkle_root_for_audit_entries(entries) == expected
+
+
+class TestIncrementalMerkleTree:
+    def test_empty_root_is_none(self) -> None:
+        assert IncrementalMerkleTree().root() is None
+
+    def test_matches_batch_root_at_every_length(self) -> None:
+        leaves = [hashlib.sha256(f"leaf-{i}".encode()).hexdigest() for i in range(17)]
+        tree = IncrementalMerkleTree()
+        for n, leaf in enumerate(leaves, start=1):
+            tree.append_leaf_hex(leaf)
+            assert len(tree) == n
+            assert tree.root() == merkle_root_from_hex_leaves(leaves[:n])
+
+    def test_append_hashes_entries_like_batch(self) -> None:
+        entries = [{"audit_id": f"audit-{i}", "outcome": "completed"} for i in range(5)]
+        tree = IncrementalMerkleTree()
+        for entry in entries:
+            tree.append(entry)
+        assert tree.root() == merkle_root_from_hex_leaves([hash_object(e) for e in entries])
+
 
 # ---------------------------------------------------------------------------
 # 3. Dual-Hash Chain Tests
@@ -292,3 +381,99 @@ class TestDualHashChainIntegrity:
             prev_sha3 = dh["sha3_256"]
             assert prev_sha256 == expected_chain[i + 1]
             assert prev_sha3 == dual_hashes[i]["sha3_256"]
+
+
+# ---------------------------------------------------------------------------
+# 4. Builder Sign Round Trip
+# ---------------------------------------------------------------------------
+
+
+class TestBuilderSignRoundTrip:
+    def _builder(self, signed_bundle: dict, entry_count: int = 4) -> BundleBuilder:
+        bundle = signed_bundle["bundle"]
+        builder = (
+            BundleBuilder()
+            .responsible_principal_record(
+                ResponsiblePrincipalRecord(**bundle["responsible_principal_record"])
+            )
+            .agent_passport(AgentPassport(**bundle["agent_passport"]))
+            .intent(Intent(**bundle["intent"]))
+            .policy_decision(PolicyDecision(**bundle["policy_decision"]))
+        )
+        template = bundle["audit_entries"][0]
+        for i in range(entry_count):
+            builder.create_audit_entry(
+                audit_id=f"audit-{i:03d}",
+                timestamp=f"2025-01-01T00:00:{i:02d}Z",
+                agent_id=template["agent_id"],
+                human_id=template["human_id"],
+                intent_id=template["intent_id"],
+                policy_decision="approved",
+                outcome="completed",
+            )
+        return builder
+
+    def test_prev_hash_chain_from_builder(self, signed_bundle: dict) -> None:
+        entries = [e.model_dump() for e in self._builder(signed_bundle).build().audit_entries]
+        prev = "GENESIS"
+        for entry in entries:
+            assert entry["prev_hash"] == prev
+            prev = hash_object(entry)
+
+    def test_builder_sign_matches_sign_bundle(self, signed_bundle: dict) -> None:
+        keys = generate_keypair()
+        builder = self._builder(signed_bundle)
+        signed = builder.sign(keys["secret_key_b64"])
+        reference = sign_bundle(builder.build(), keys["secret_key_b64"])
+
+        assert signed["signature"]["bundle_hash"] == reference["signature"]["bundle_hash"]
+        assert signed["signature"]["merkle_root"] == reference["signature"]["merkle_root"]
+        assert verify_signed_bundle(signed, keys["public_key_b64"]) == {"verified": True}
+
+
+# ---------------------------------------------------------------------------
+# 9. Compiled schema validation (fastjsonschema fast path)
+# ---------------------------------------------------------------------------
+
+
+class TestCompiledSchemaValidation:
+    """Pin the fastjsonschema fast path to the jsonschema result shape."""
+
+    @pytest.fixture(autouse=True)
+    def _require_fastjsonschema(self):
+        pytest.importorskip("fastjsonschema")
+
+    def _both_paths(self, monkeypatch, schema_name: str, data: dict) -> tuple[dict, dict]:
+        from dcp_ai import schema as schema_mod
+
+        assert schema_mod._get_compiled_validator(schema_name) is not None
+        fast = schema_mod.validate_schema(schema_name, data)
+        monkeypatch.setattr(schema_mod, "_fastjsonschema", None)
+        slow = schema_mod.validate_schema(schema_name, data)
+        return fast, slow
+
+    def test_valid_intent_both_paths(self, signed_bundle: dict, monkeypatch) -> None:
+        fast, slow = self._both_paths(monkeypatch, "intent", signed_bundle["bundle"]["intent"])
+        assert fast == {"valid": True}
+        assert slow == {"valid": True}
+
+    def test_invalid_intent_both_paths(self, signed_bundle: dict, monkeypatch) -> None:
+        broken = dict(signed_bundle["bundle"]["intent"])
+        del broken["intent_id"]
+        fast, slow = self._both_paths(monkeypatch, "intent", broken)
+        # Error text differs between the two libraries; the contract is
+        # the verdict plus a non-empty list of path-prefixed messages
+        # (the fast path reports only the first violation).
+        for result in (fast, slow):
+            assert result["valid"] is False
+            assert result["errors"]
+            assert all(isinstance(e, str) for e in result["errors"])
+        assert len(fast["errors"]) <= len(slow["errors"])
+
+    def test_unknown_schema_both_paths(self, monkeypatch) -> None:
+        from dcp_ai import schema as schema_mod
+
+        fast = schema_mod.validate_schema("no_such_schema", {})
+        monkeypatch.setattr(schema_mod, "_fastjsonschema", None)
+        slow = schema_mod.validate_schema("no_such_schema", {})
+        assert fast == slow == {"valid": False, "errors": ["Schema not found: no_such_schema"]}
@@ -97,7 +97,7 @@ class TestDCPOpenAIClient:
         )
         assert client.session_nonce
         assert len(client.session_nonce) == 64
-        assert client.audit_trail == []
+        assert len(client.audit_trail) == 0
 
     def test_session_nonce_preserved(self):
         from dcp_ai.openai import DCPOpenAIClient
@@ -134,6 +134,129 @@ class TestDCPOpenAIClient:
         assert trail[0]["agent_id"] == "agent:x"
         assert trail[0]["outcome"] == "chat_completion"
 
+    def test_async_chat_completion_builds_audit_trail(self):
+        import asyncio
+
+        from dcp_ai.openai import DCPOpenAIClient
+
+        mock_response = MagicMock()
+        mock_response.id = "resp-456"
+
+        async def async_create(**kwargs):
+            return mock_response
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = async_create
+
+        client = DCPOpenAIClient(
+            openai_client=mock_client,
+            passport={"agent_id": "agent:x"},
+            rpr={"human_id": "rpr:y"},
+        )
+        result = asyncio.new_event_loop().run_until_complete(
+            client.chat_completions_acreate(
+                model="gpt-4",
+                messages=[{"role": "user", "content": "Hello"}],
+            )
+        )
+        assert result == mock_response
+        trail = client.get_audit_trail()
+        assert len(trail) == 1
+        assert trail[0]["outcome"] == "chat_completion"
+        assert trail[0]["evidence"]["result_ref"] == "resp-456"
+
+
+# ---------------------------------------------------------------------------
+# Fast-path record builders shared by the integrations
+# ---------------------------------------------------------------------------
+
+
+class TestFastRecords:
+    """Pin the plain-dict builders to the Pydantic models' model_dump() shape."""
+
+    def test_result_ref_prefers_id_and_bounds_size(self):
+        from dcp_ai.v2.fast_records import result_ref
+
+        class WithId:
+            id = "resp-42"
+
+        assert result_ref(WithId()) == "resp-42"
+        assert result_ref("short output") == "short output"
+        long_ref = result_ref("x" * 10_000)
+        assert long_ref.startswith("blake2b:")
+        assert len(long_ref) < 40
+
+    def test_audit_canonicalizer_matches_canonicalize_v2(self):
+        from dcp_ai.v2.canonicalize import canonicalize_v2
+        from dcp_ai.v2.fast_records import AuditEntryCanonicalizer, audit_event_dict
+
+        canon = AuditEntryCanonicalizer("agent:α", "rpr:h", "n" * 64)
+        entry = audit_event_dict(
+            audit_id="audit-1",
+            session_nonce="n" * 64,
+            prev_hash="GENESIS",
+            timestamp="2026-01-01T00:00:00+00:00",
+            agent_id="agent:α",
+            human_id="rpr:h",
+            intent_id="intent-1",
+            intent_hash="sha256:" + "a" * 64,
+            policy_decision="approved",
+            outcome='completed "with quotes" and ünïcode',
+            evidence={"tool": "openai", "nested": {"k": [1, 2, None]}},
+        )
+        assert canon.canonicalize(entry) == canonicalize_v2(entry)
+        assert canon.hash(entry).startswith("sha256:")
+
+    def test_intent_dict_matches_model_dump(self):
+        from dcp_ai.v2.fast_records import intent_dict
+        from dcp_ai.v2.models import IntentV2
+
+        d = intent_dict(
+            intent_id="intent-1",
+            session_nonce="n" * 64,
+            agent_id="agent:a",
+            human_id="rpr:h",
+            timestamp="2026-01-01T00:00:00+00:00",
+            action_type="api_call",
+            target={"channel": "api"},
+            data_classes=["none"],
+            estimated_impact="low",
+        )
+        assert IntentV2.model_validate(d).model_dump() == d
+
+    def test_audit_event_dict_matches_model_dump(self):
+        from dcp_ai.v2.fast_records import audit_event_dict
+        from dcp_ai.v2.models import AuditEventV2
+
+        d = audit_event_dict(
+            audit_id="audit-1",
+            session_nonce="n" * 64,
+            prev_hash="GENESIS",
+            timestamp="2026-01-01T00:00:00+00:00",
+            agent_id="agent:a",
+            human_id="rpr:h",
+            intent_id="intent-1",
+            intent_hash="sha256:abc",
+            policy_decision="approved",
+            outcome="completed",
+            evidence={"tool": "test"},
+        )
+        assert AuditEventV2.model_validate(d).model_dump() == d
+
+    def test_policy_decision_dict_matches_model_dump(self):
+        from dcp_ai.v2.fast_records import policy_decision_dict
+        from dcp_ai.v2.models import PolicyDecisionV2
+
+        d = policy_decision_dict(
+            intent_id="intent-1",
+            session_nonce="n" * 64,
+            decision="approve",
+            risk_score=250,
+            reasons=["auto_approved_low_risk"],
+            timestamp="2026-01-01T00:00:00+00:00",
+        )
+        assert PolicyDecisionV2.model_validate(d).model_dump() == d
+
 
 # ---------------------------------------------------------------------------
 # LangChain integration
@@ -154,26 +277,6 @@ class TestLangChainRiskScoring:
         score = _compute_risk_score("initiate_payment", "high", ["financial_data"])
         assert score >= 500
 
-    def test_compute_security_tier_routine(self):
-        from dcp_ai.langchain import _compute_security_tier
-
-        assert _compute_security_tier(100, ["none"], "browse") == "routine"
-
-    def test_compute_security_tier_maximum(self):
-        from dcp_ai.langchain import _compute_security_tier
-
-        assert _compute_security_tier(900, ["credentials"], "execute_code") == "maximum"
-
-    def test_compute_security_tier_elevated_payment(self):
-        from dcp_ai.langchain import _compute_security_tier
-
-        assert _compute_security_tier(300, ["none"], "initiate_payment") == "elevated"
-
-    def test_compute_security_tier_elevated_sensitive(self):
-        from dcp_ai.langchain import _compute_security_tier
-
-        assert _compute_security_tier(300, ["pii"], "api_call") == "elevated"
-
 
 class TestDCPAgentWrapper:
     def test_creates_intent_and_audit(self):
@@ -293,6 +396,22 @@ class TestDCPCrewAgent:
         )
         assert agent.get_session_nonce() == "d" * 64
 
+    def test_bounded_trail_evicts_but_merkle_root_covers_all(self):
+        from dcp_ai.crewai import DCPCrewAgent
+        from dcp_ai.merkle import merkle_root_for_audit_entries
+
+        agent = DCPCrewAgent(
+            role="x",
+            passport={"agent_id": "a"},
+            rpr={"human_id": "h"},
+            audit_max_len=3,
+        )
+        entries = [agent.log_action() for _ in range(8)]
+        assert len(agent.get_audit_trail()) == 3
+        assert agent.get_audit_trail() == entries[-3:]
+        # Evicted entries stay covered by the incremental root.
+        assert agent.get_merkle_root() == merkle_root_for_audit_entries(entries)
+
 
 class TestDCPCrew:
     def _make_crew(self):
@@ -318,6 +437,15 @@ class TestDCPCrew:
         for agent_info in result["agents"]:
             assert agent_info["audit_entries"] == 1
 
+    def test_kickoff_parallel_generates_audit_for_all_agents(self):
+        crew = self._make_crew()
+        result = crew.kickoff_parallel(task="Write a report")
+        assert result["dcp_version"] == "2.0"
+        assert len(result["agents"]) == 2
+        for agent_info in result["agents"]:
+            assert agent_info["audit_entries"] == 1
+        assert len(crew.get_combined_audit_trail()) == 2
+
     def test_combined_audit_trail(self):
         crew = self._make_crew()
         crew.kickoff(task="Test task")
@@ -511,6 +639,194 @@ class TestFastAPIV2Structure:
         assert any("PQ" in e for e in result["errors"])
 
 
+class TestDCPVerifyMiddleware:
+    def _make_app(self, **middleware_kwargs):
+        from dcp_ai.fastapi import DCPVerifyMiddleware
+
+        async def app(scope, receive, send):
+            # Drain the (possibly replayed) request body like a real app would.
+            while True:
+                message = await receive()
+                if message["type"] != "http.request" or not message.get("more_body"):
+                    break
+            agent = scope.get("state", {}).get("dcp_agent")
+            payload = json.dumps(
+                {
+                    "has_agent": agent is not None,
+                    "agent_id": agent.agent_id if agent else None,
+                }
+            ).encode()
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-type", b"application/json")],
+                }
+            )
+            await send({"type": "http.response.body", "body": payload})
+
+        return DCPVerifyMiddleware(app, **middleware_kwargs)
+
+    def _make_valid_v2_header(self):
+        return json.dumps(TestFastAPIV2Structure()._make_valid_v2_bundle())
+
+    def test_passthrough_without_bundle(self):
+        from starlette.testclient import TestClient
+
+        client = TestClient(self._make_app(require_bundle=False))
+        resp = client.post("/action", json={"input": "hello"})
+        assert resp.status_code == 200
+        assert resp.json()["has_agent"] is False
+
+    def test_require_bundle_missing(self):
+        from starlette.testclient import TestClient
+
+        client = TestClient(self._make_app(require_bundle=True))
+        resp = client.post("/action", json={"input": "hello"})
+        assert resp.status_code == 403
+        assert resp.json()["verified"] is False
+
+    def test_valid_v2_header_injects_context(self):
+        from starlette.testclient import TestClient
+
+        client = TestClient(self._make_app(require_bundle=True))
+        resp = client.post(
+            "/action",
+            json={},
+            headers={"x-dcp-bundle": self._make_valid_v2_header()},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["has_agent"] is True
+
+    def test_body_fallback_when_bundle_required(self):
+        from starlette.testclient import TestClient
+
+        client = TestClient(self._make_app(require_bundle=True))
+        resp = client.post(
+            "/action",
+            json={"signed_bundle": TestFastAPIV2Structure()._make_valid_v2_bundle()},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["has_agent"] is True
+
+    def test_no_body_fallback_in_permissive_mode(self):
+        from unittest.mock import patch
+
+        from starlette.testclient import TestClient
+
+        import dcp_ai.fastapi as fastapi_mod
+
+        client = TestClient(self._make_app(require_bundle=False))
+        with patch.object(fastapi_mod, "_verify_and_build_context") as verify:
+            resp = client.post(
+                "/action",
+                json={"signed_bundle": TestFastAPIV2Structure()._make_valid_v2_bundle()},
+            )
+        assert resp.status_code == 200
+        # Permissive mode never reads the body, so no verification runs.
+        assert resp.json()["has_agent"] is False
+        verify.assert_not_called()
+
+    def test_non_json_body_not_buffered(self):
+        from starlette.testclient import TestClient
+
+        client = TestClient(self._make_app(require_bundle=False))
+        resp = client.post(
+            "/action",
+            content=b"x" * 1024,
+            headers={"content-type": "application/octet-stream"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["has_agent"] is False
+
+    def test_repeated_header_hits_verify_cache(self):
+        from unittest.mock import patch
+
+        from starlette.testclient import TestClient
+
+        import dcp_ai.fastapi as fastapi_mod
+
+        middleware = self._make_app(require_bundle=True)
+        client = TestClient(middleware)
+        header = self._make_valid_v2_header()
+        with patch.object(
+            fastapi_mod,
+            "_verify_and_build_context",
+            wraps=fastapi_mod._verify_and_build_context,
+        ) as verify:
+            for _ in range(3):
+                resp = client.post(
+                    "/action", json={}, headers={"x-dcp-bundle": header}
+                )
+                assert resp.status_code == 200
+                assert resp.json()["has_agent"] is True
+            assert verify.call_count == 1
+
+    def test_verify_cache_can_be_disabled(self):
+        middleware = self._make_app(require_bundle=True, cache_size=0)
+        assert middleware._verify_cache is None
+
+    def test_body_fallback_result_not_cached_under_header_key(self):
+        from starlette.testclient import TestClient
+
+        client = TestClient(self._make_app(require_bundle=True))
+        junk_header = {"x-dcp-bundle": "not-json"}
+        # Unparseable header, valid bundle in the body: verifies via fallback.
+        resp = client.post(
+            "/action",
+            json={"signed_bundle": TestFastAPIV2Structure()._make_valid_v2_bundle()},
+            headers=junk_header,
+        )
+        assert resp.status_code == 200
+        assert resp.json()["has_agent"] is True
+        # Same junk header, no bundle anywhere: the fallback verdict must
+        # not have been cached under the header's key.
+        resp = client.post("/action", json={}, headers=junk_header)
+        assert resp.status_code == 403
+
+    def test_cache_hit_returns_fresh_context_copy(self):
+        from starlette.testclient import TestClient
+
+        from dcp_ai.fastapi import DCPVerifyMiddleware
+
+        seen: list[str] = []
+
+        async def app(scope, receive, send):
+            while True:
+                message = await receive()
+                if message["type"] != "http.request" or not message.get("more_body"):
+                    break
+            agent = scope["state"]["dcp_agent"]
+            seen.append(agent.agent_id)
+            # A careless handler mutating its context must not poison
+            # the cached verdict for later requests.
+            agent.agent_id = "tampered"
+            agent.passport["agent_id"] = "tampered"
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"{}"})
+
+        client = TestClient(DCPVerifyMiddleware(app, require_bundle=True))
+        header = {"x-dcp-bundle": self._make_valid_v2_header()}
+        for _ in range(3):
+            assert client.post("/action", json={}, headers=header).status_code == 200
+        assert seen == [seen[0]] * 3
+        assert seen[0] != "tampered"
+
+    def test_invalid_v2_bundle_rejected(self):
+        from starlette.testclient import TestClient
+
+        bundle = TestFastAPIV2Structure()._make_valid_v2_bundle()
+        del bundle["bundle"]["manifest"]
+        client = TestClient(self._make_app(require_bundle=True))
+        resp = client.post(
+            "/action",
+            json={},
+            headers={"x-dcp-bundle": json.dumps(bundle)},
+        )
+        assert resp.status_code == 403
+        assert resp.json()["verified"] is False
+
+
 class TestFastAPIDCPAgentContext:
     def test_dataclass_defaults(self):
         from dcp_ai.fastapi import DCPAgentContext